@@ -2,9 +2,187 @@
 
 from __future__ import annotations
 
-from app.schemas.graph_config import GraphConfig, parse_graph_config
+from functools import lru_cache
+from typing import TYPE_CHECKING
 
+from app.schemas.graph_config import (
+    ComponentDependencyRef,
+    ComponentGraphNode,
+    ComponentNodeConfig,
+    ComponentReference,
+    EdgePredicate,
+    GraphConfig,
+    GraphDeps,
+    GraphEdgeConfig,
+    GraphExecutionLimits,
+    GraphIR,
+    GraphMetadata,
+    GraphNodeConfig,
+    GraphNodeKind,
+    GraphStateConfig,
+    PredicateOperator,
+    StateFieldSchema,
+    StateFieldType,
+    StateReducerType,
+)
+from app.schemas.prompt_config import PromptConfig
+
+if TYPE_CHECKING:
+    # Declared for static analysis only; the real value is materialized
+    # lazily by __getattr__ below.
+    DEEP_RESEARCH_CONFIG: GraphConfig
+
+
+# Shared literals reused across nodes, edges and deps so each config holds one
+# reference per string instead of a fresh allocation per occurrence.
+_COMPONENT_VERSION = "^2.0"
+_CLARIFY_KEY = "deep_research:clarify"
+_BRIEF_KEY = "deep_research:brief"
+_SUPERVISOR_KEY = "deep_research:supervisor"
+_FINAL_REPORT_KEY = "deep_research:final_report"
+
+
+def _component_node(
+    *,
+    id: str,
+    name: str,
+    description: str,
+    reads: list[str],
+    writes: list[str],
+    key: str,
+) -> ComponentGraphNode:
+    return ComponentGraphNode(
+        id=id,
+        name=name,
+        kind=GraphNodeKind.COMPONENT,
+        description=description,
+        reads=reads,
+        writes=writes,
+        config=ComponentNodeConfig(component_ref=ComponentReference(key=key, version=_COMPONENT_VERSION)),
+    )
 
+
+# Pre-validated building blocks: every field except the supervisor overrides
+# and the limits is constant, so the Pydantic validation cost is paid once at
+# import instead of per create_deep_research_config call.
+_CLARIFY_NODE = _component_node(
+    id="clarify",
+    name="Clarify with User",
+    description="Analyze query and determine if clarification is needed",
+    reads=["messages"],
+    writes=["messages", "need_clarification", "skip_research"],
+    key=_CLARIFY_KEY,
+)
+
+_BRIEF_NODE = _component_node(
+    id="brief",
+    name="Write Research Brief",
+    description="Transform user messages into structured research brief",
+    reads=["messages"],
+    writes=["research_brief"],
+    key=_BRIEF_KEY,
+)
+
+_SUPERVISOR_NODE = _component_node(
+    id="supervisor",
+    name="Research Supervisor",
+    description="Coordinate research by delegating to sub-researchers",
+    reads=["messages", "research_brief", "notes"],
+    writes=["notes"],
+    key=_SUPERVISOR_KEY,
+)
+
+_FINAL_REPORT_NODE = _component_node(
+    id="final_report",
+    name="Final Report",
+    description="Synthesize research findings into comprehensive report",
+    reads=["messages", "research_brief", "notes"],
+    writes=["messages", "final_report"],
+    key=_FINAL_REPORT_KEY,
+)
+
+_CLARIFY_EDGES = (
+    GraphEdgeConfig(
+        from_node="clarify",
+        to_node="END",
+        when=EdgePredicate(state_path="need_clarification", operator=PredicateOperator.TRUTHY),
+        label="Ask clarifying question",
+        priority=2,
+    ),
+    GraphEdgeConfig(
+        from_node="clarify",
+        to_node="END",
+        when=EdgePredicate(state_path="skip_research", operator=PredicateOperator.TRUTHY),
+        label="Handle follow-up directly",
+        priority=1,
+    ),
+    GraphEdgeConfig(
+        from_node="clarify",
+        to_node="brief",
+        when=EdgePredicate(state_path="need_clarification", operator=PredicateOperator.FALSY),
+        label="Proceed to research",
+        priority=0,
+    ),
+)
+
+_COMMON_EDGES = (
+    GraphEdgeConfig(from_node="brief", to_node="supervisor"),
+    GraphEdgeConfig(from_node="supervisor", to_node="final_report"),
+    GraphEdgeConfig(from_node="final_report", to_node="END"),
+)
+
+_STATE_CONFIG = GraphStateConfig(
+    schema={
+        "research_brief": StateFieldSchema(
+            type=StateFieldType.STRING,
+            default="",
+            description="Generated research brief that guides the research",
+        ),
+        "notes": StateFieldSchema(
+            type=StateFieldType.LIST,
+            default=[],
+            description="Collected research notes from supervisor",
+        ),
+        "final_report": StateFieldSchema(
+            type=StateFieldType.STRING,
+            default="",
+            description="Final synthesized research report",
+        ),
+        "need_clarification": StateFieldSchema(
+            type=StateFieldType.BOOL,
+            default=False,
+            description="Whether user clarification is needed",
+        ),
+        "skip_research": StateFieldSchema(
+            type=StateFieldType.BOOL,
+            default=False,
+            description="Whether to skip research for follow-up requests",
+        ),
+    },
+    reducers={"notes": StateReducerType.REPLACE},
+)
+
+_DEPS = GraphDeps(
+    models=[],
+    tools=[],
+    prompts=[],
+    components=[
+        ComponentDependencyRef(key=_BRIEF_KEY, version=_COMPONENT_VERSION),
+        ComponentDependencyRef(key=_CLARIFY_KEY, version=_COMPONENT_VERSION),
+        ComponentDependencyRef(key=_FINAL_REPORT_KEY, version=_COMPONENT_VERSION),
+        ComponentDependencyRef(key=_SUPERVISOR_KEY, version=_COMPONENT_VERSION),
+    ],
+)
+
+_METADATA = GraphMetadata(
+    display_name="Deep Research",
+    description="Multi-phase deep research workflow",
+    tags=["research", "multi-phase", "components"],
+    agent_version="3.0.0",
+)
+
+
+@lru_cache(maxsize=32)
 def create_deep_research_config(
     *,
     allow_clarification: bool = True,
@@ -13,202 +191,69 @@ def create_deep_research_config(
 ) -> GraphConfig:
     entrypoint = "clarify" if allow_clarification else "brief"
 
-    nodes: list[dict[str, object]] = []
-    edges: list[dict[str, object]] = []
-
-    if allow_clarification:
-        nodes.append(
-            {
-                "id": "clarify",
-                "name": "Clarify with User",
-                "kind": "component",
-                "description": "Analyze query and determine if clarification is needed",
-                "reads": ["messages"],
-                "writes": ["messages", "need_clarification", "skip_research"],
-                "config": {
-                    "component_ref": {"key": "deep_research:clarify", "version": "^2.0"},
-                },
-            }
-        )
-        edges.extend(
-            [
-                {
-                    "from_node": "clarify",
-                    "to_node": "END",
-                    "when": {
-                        "state_path": "need_clarification",
-                        "operator": "truthy",
-                    },
-                    "label": "Ask clarifying question",
-                    "priority": 2,
-                },
-                {
-                    "from_node": "clarify",
-                    "to_node": "END",
-                    "when": {
-                        "state_path": "skip_research",
-                        "operator": "truthy",
-                    },
-                    "label": "Handle follow-up directly",
-                    "priority": 1,
-                },
-                {
-                    "from_node": "clarify",
-                    "to_node": "brief",
-                    "when": {
-                        "state_path": "need_clarification",
-                        "operator": "falsy",
-                    },
-                    "label": "Proceed to research",
-                    "priority": 0,
-                },
-            ]
-        )
-
-    nodes.extend(
-        [
-            {
-                "id": "brief",
-                "name": "Write Research Brief",
-                "kind": "component",
-                "description": "Transform user messages into structured research brief",
-                "reads": ["messages"],
-                "writes": ["research_brief"],
-                "config": {
-                    "component_ref": {"key": "deep_research:brief", "version": "^2.0"},
-                },
-            },
-            {
-                "id": "supervisor",
-                "name": "Research Supervisor",
-                "kind": "component",
-                "description": "Coordinate research by delegating to sub-researchers",
-                "reads": ["messages", "research_brief", "notes"],
-                "writes": ["notes"],
-                "config": {
-                    "component_ref": {"key": "deep_research:supervisor", "version": "^2.0"},
-                    "config_overrides": {
-                        "max_iterations": max_iterations,
-                        "max_concurrent_units": max_concurrent_units,
-                    },
-                },
-            },
-            {
-                "id": "final_report",
-                "name": "Final Report",
-                "kind": "component",
-                "description": "Synthesize research findings into comprehensive report",
-                "reads": ["messages", "research_brief", "notes"],
-                "writes": ["messages", "final_report"],
-                "config": {
-                    "component_ref": {"key": "deep_research:final_report", "version": "^2.0"},
+    supervisor = _SUPERVISOR_NODE.model_copy(
+        update={
+            "config": ComponentNodeConfig(
+                component_ref=_SUPERVISOR_NODE.config.component_ref,
+                config_overrides={
+                    "max_iterations": max_iterations,
+                    "max_concurrent_units": max_concurrent_units,
                 },
-            },
-        ]
+            )
+        }
     )
 
+    nodes: list[GraphNodeConfig] = [_BRIEF_NODE, supervisor, _FINAL_REPORT_NODE]
+    edges = list(_COMMON_EDGES)
     if allow_clarification:
-        edges.append({"from_node": "brief", "to_node": "supervisor"})
-    else:
-        edges.extend(
-            [
-                {"from_node": "brief", "to_node": "supervisor"},
-            ]
-        )
-    edges.extend(
-        [
-            {"from_node": "supervisor", "to_node": "final_report"},
-            {"from_node": "final_report", "to_node": "END"},
-        ]
-    )
+        nodes.insert(0, _CLARIFY_NODE)
+        edges = [*_CLARIFY_EDGES, *edges]
 
-    return parse_graph_config(
-        {
-            "schema_version": "3.0",
-            "key": "deep_research",
-            "revision": 1,
-            "graph": {
-                "entrypoints": [entrypoint],
-                "nodes": nodes,
-                "edges": edges,
+    return GraphConfig(
+        schema_version="3.0",
+        key="deep_research",
+        revision=1,
+        graph=GraphIR(
+            entrypoints=[entrypoint],
+            nodes=nodes,
+            edges=edges,
+        ),
+        state=_STATE_CONFIG,
+        deps=_DEPS,
+        limits=GraphExecutionLimits(
+            max_time_s=600,
+            max_steps=256,
+            max_concurrency=max_concurrent_units,
+        ),
+        prompt_config=PromptConfig(custom_instructions=""),
+        metadata=_METADATA,
+        ui={
+            "icon": "microscope",
+            "author": "Xyzen",
+            "pattern": "multi-phase-research",
+            "builtin_key": "deep_research",
+            "publishable": True,
+            "config": {
+                "allow_clarification": allow_clarification,
+                "max_iterations": max_iterations,
+                "max_concurrent_units": max_concurrent_units,
             },
-            "state": {
-                "schema": {
-                    "research_brief": {
-                        "type": "string",
-                        "default": "",
-                        "description": "Generated research brief that guides the research",
-                    },
-                    "notes": {
-                        "type": "list",
-                        "default": [],
-                        "description": "Collected research notes from supervisor",
-                    },
-                    "final_report": {
-                        "type": "string",
-                        "default": "",
-                        "description": "Final synthesized research report",
-                    },
-                    "need_clarification": {
-                        "type": "bool",
-                        "default": False,
-                        "description": "Whether user clarification is needed",
-                    },
-                    "skip_research": {
-                        "type": "bool",
-                        "default": False,
-                        "description": "Whether to skip research for follow-up requests",
-                    },
-                },
-                "reducers": {
-                    "notes": "replace",
-                },
-            },
-            "deps": {
-                "models": [],
-                "tools": [],
-                "prompts": [],
-                "components": [
-                    {"key": "deep_research:brief", "version": "^2.0"},
-                    {"key": "deep_research:clarify", "version": "^2.0"},
-                    {"key": "deep_research:final_report", "version": "^2.0"},
-                    {"key": "deep_research:supervisor", "version": "^2.0"},
-                ],
-            },
-            "limits": {
-                "max_time_s": 600,
-                "max_steps": 256,
-                "max_concurrency": max_concurrent_units,
-            },
-            "prompt_config": {
-                "custom_instructions": "",
-            },
-            "metadata": {
-                "display_name": "Deep Research",
-                "description": "Multi-phase deep research workflow",
-                "tags": ["research", "multi-phase", "components"],
-                "agent_version": "3.0.0",
-            },
-            "ui": {
-                "icon": "microscope",
-                "author": "Xyzen",
-                "pattern": "multi-phase-research",
-                "builtin_key": "deep_research",
-                "publishable": True,
-                "config": {
-                    "allow_clarification": allow_clarification,
-                    "max_iterations": max_iterations,
-                    "max_concurrent_units": max_concurrent_units,
-                },
-            },
-        }
+        },
     )
 
 
-DEEP_RESEARCH_CONFIG = create_deep_research_config(
-    allow_clarification=True,
-    max_iterations=24,
-    max_concurrent_units=12,
-)
+def __getattr__(name: str) -> GraphConfig:
+    # PEP 562: build the default config on first access instead of at import
+    # time, so importing the package doesn't pay the Pydantic validation cost.
+    if name == "DEEP_RESEARCH_CONFIG":
+        config = create_deep_research_config(
+            allow_clarification=True,
+            max_iterations=24,
+            max_concurrent_units=12,
+        )
+        globals()["DEEP_RESEARCH_CONFIG"] = config
+        return config
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = ["DEEP_RESEARCH_CONFIG", "create_deep_research_config"]
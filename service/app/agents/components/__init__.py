@@ -8,6 +8,23 @@ discovery, and retrieval of reusable components.
 from __future__ import annotations
 
 import logging
+import threading
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from packaging.specifiers import SpecifierSet
+    from packaging.version import Version
+
+    _has_packaging = True
+else:
+    try:
+        from packaging.specifiers import SpecifierSet
+        from packaging.version import Version
+
+        _has_packaging = True
+    except ImportError:  # pragma: no cover - packaging ships with pydantic
+        SpecifierSet = Version = None
+        _has_packaging = False
 
 from .component import (
     BaseComponent,
@@ -19,6 +36,46 @@ from .component import (
 logger = logging.getLogger(__name__)
 
 
+# Parsed SpecifierSet per raw constraint string, shared across registry
+# instances - the constraint alphabet is tiny and never shrinks.
+_SPEC_CACHE: dict[str, SpecifierSet] = {}
+
+
+def _parse_semver(version: str) -> tuple[int, int, int] | None:
+    """Parse a plain X[.Y[.Z]] version into an int tuple, or None if not plain."""
+    parts = version.split(".")
+    if not 1 <= len(parts) <= 3:
+        return None
+    try:
+        numbers = [int(p) for p in parts]
+    except ValueError:
+        # Pre-release/build tags etc. fall back to the packaging path.
+        return None
+    while len(numbers) < 3:
+        numbers.append(0)
+    return (numbers[0], numbers[1], numbers[2])
+
+
+def _parse_version_constraint(version_constraint: str) -> SpecifierSet:
+    """Parse a SemVer constraint string into a SpecifierSet."""
+    # Handle caret constraint (^X.Y.Z) - allow compatible versions
+    if version_constraint.startswith("^"):
+        base_version = version_constraint[1:]
+        base = Version(base_version)
+        # ^2.0 means >=2.0.0, <3.0.0
+        next_major = f"{base.major + 1}.0.0"
+        return SpecifierSet(f">={base_version},<{next_major}")
+    # Handle tilde constraint (~X.Y.Z) - allow patch updates
+    if version_constraint.startswith("~"):
+        base_version = version_constraint[1:]
+        base = Version(base_version)
+        # ~2.0.1 means >=2.0.1, <2.1.0
+        next_minor = f"{base.major}.{base.minor + 1}.0"
+        return SpecifierSet(f">={base_version},<{next_minor}")
+    # Standard specifier (>=, <=, ==, etc.)
+    return SpecifierSet(version_constraint)
+
+
 class ComponentRegistry:
     """
     Registry for reusable agent components.
@@ -29,6 +86,20 @@ class ComponentRegistry:
 
     def __init__(self) -> None:
         self._components: dict[str, ExecutableComponent] = {}
+        # Two-level {namespace: {name: component}} view for prefix queries
+        # (e.g. all 'deep_research:*'); the flat dict above stays the O(1)
+        # full-key lookup used on the hot path. Un-namespaced keys such as
+        # 'react' live under the "" namespace with their full key as name.
+        self._namespaces: dict[str, dict[str, ExecutableComponent]] = {}
+        # Parsed versions per component key - immutable after registration,
+        # so parsing once keeps resolve() to dict lookups on the hot path.
+        self._versions: dict[str, Version] = {}
+        # Plain (major, minor, patch) tuples for the caret fast path.
+        self._semvers: dict[str, tuple[int, int, int]] = {}
+        # Snapshots for list_all/list_metadata; registration is append-only
+        # after startup, so these are rebuilt only after a register() call.
+        self._keys_snapshot: tuple[str, ...] | None = None
+        self._metadata_snapshot: tuple[ComponentMetadata, ...] | None = None
 
     def register(self, component: ExecutableComponent, override: bool = False) -> None:
         """
@@ -52,6 +123,27 @@ class ComponentRegistry:
             logger.warning(f"Component '{key}' has validation warnings: {errors}")
 
         self._components[key] = component
+        namespace, _, name = key.partition(":")
+        if not name:
+            namespace, name = "", key
+        self._namespaces.setdefault(namespace, {})[name] = component
+        self._keys_snapshot = None
+        self._metadata_snapshot = None
+        # Compile the config_overrides contract once so graph builds don't
+        # re-derive required/allowed key sets from config_schema_json.
+        component._overrides_validator = component._compile_overrides_validator()
+        if _has_packaging:
+            try:
+                self._versions[key] = Version(component.metadata.version)
+            except Exception as e:
+                # Keep resolve() permissive for unparseable versions.
+                logger.warning(f"Version parsing failed for {key}: {e}")
+                self._versions.pop(key, None)
+        semver = _parse_semver(component.metadata.version)
+        if semver is not None:
+            self._semvers[key] = semver
+        else:
+            self._semvers.pop(key, None)
         logger.info(f"Registered component: {key} ({component.metadata.component_type})")
 
     def get(self, key: str) -> ExecutableComponent | None:
@@ -77,53 +169,63 @@ class ComponentRegistry:
         if version_constraint == "*":
             return component
 
-        # Check version compatibility using packaging library
-        try:
-            from packaging.specifiers import SpecifierSet
-            from packaging.version import Version
-
-            comp_version = Version(component.metadata.version)
-
-            # Handle caret constraint (^X.Y.Z) - allow compatible versions
-            if version_constraint.startswith("^"):
-                base_version = version_constraint[1:]
-                base = Version(base_version)
-                # ^2.0 means >=2.0.0, <3.0.0
-                next_major = f"{base.major + 1}.0.0"
-                specifier = SpecifierSet(f">={base_version},<{next_major}")
-            # Handle tilde constraint (~X.Y.Z) - allow patch updates
-            elif version_constraint.startswith("~"):
-                base_version = version_constraint[1:]
-                base = Version(base_version)
-                # ~2.0.1 means >=2.0.1, <2.1.0
-                next_minor = f"{base.major}.{base.minor + 1}.0"
-                specifier = SpecifierSet(f">={base_version},<{next_minor}")
-            else:
-                # Standard specifier (>=, <=, ==, etc.)
-                specifier = SpecifierSet(version_constraint)
-
-            if comp_version in specifier:
-                return component
-            else:
-                logger.debug(f"Component {key} version {comp_version} doesn't match constraint {version_constraint}")
+        # Fast path for the dominant ^X[.Y[.Z]] form: a few integer compares,
+        # no SpecifierSet involved. Pre-release versions or exotic constraints
+        # fall through to the packaging path below.
+        if version_constraint.startswith("^"):
+            comp_semver = self._semvers.get(key)
+            base_semver = _parse_semver(version_constraint[1:])
+            if comp_semver is not None and base_semver is not None:
+                # ^X.Y.Z means >=X.Y.Z, <(X+1).0.0
+                if comp_semver >= base_semver and comp_semver[0] == base_semver[0]:
+                    return component
+                logger.debug(f"Component {key} version {comp_semver} doesn't match constraint {version_constraint}")
                 return None
 
-        except ImportError:
+        if not _has_packaging:
             # If packaging library is not available, return component anyway
             logger.warning("packaging library not installed, skipping version check")
             return component
+
+        comp_version = self._versions.get(key)
+        if comp_version is None:
+            # Version parsing failed at registration; stay permissive.
+            logger.warning(f"Component {key} has no parsed version, skipping version check")
+            return component
+
+        try:
+            specifier = _SPEC_CACHE.get(version_constraint)
+            if specifier is None:
+                specifier = _parse_version_constraint(version_constraint)
+                _SPEC_CACHE[version_constraint] = specifier
         except Exception as e:
-            # If version parsing fails, log warning and return component anyway
+            # If constraint parsing fails, log warning and return component anyway
             logger.warning(f"Version parsing failed for {key}: {e}, returning component")
             return component
 
+        if comp_version in specifier:
+            return component
+        else:
+            logger.debug(f"Component {key} version {comp_version} doesn't match constraint {version_constraint}")
+            return None
+
+    def list_namespace(self, namespace: str) -> list[ExecutableComponent]:
+        """List all components registered under a key namespace (prefix before ':')."""
+        return list(self._namespaces.get(namespace, {}).values())
+
     def list_all(self) -> list[str]:
         """List all registered component keys."""
-        return list(self._components.keys())
+        snapshot = self._keys_snapshot
+        if snapshot is None:
+            snapshot = self._keys_snapshot = tuple(self._components.keys())
+        return list(snapshot)
 
     def list_metadata(self) -> list[ComponentMetadata]:
         """Get metadata for all registered components."""
-        return [comp.metadata for comp in self._components.values()]
+        snapshot = self._metadata_snapshot
+        if snapshot is None:
+            snapshot = self._metadata_snapshot = tuple(comp.metadata for comp in self._components.values())
+        return list(snapshot)
 
 
 # Global registry instance
@@ -131,6 +233,7 @@ component_registry = ComponentRegistry()
 
 # Track if components have been registered
 _components_registered = False
+_registration_lock = threading.Lock()
 
 
 def ensure_components_registered() -> None:
@@ -138,13 +241,24 @@ def ensure_components_registered() -> None:
     Ensure all builtin components are registered.
 
     This should be called before building any graph that uses components.
-    Safe to call multiple times - only registers once.
+    Safe to call multiple times and from multiple threads - only registers once.
     """
     global _components_registered
 
     if _components_registered:
         return
 
+    with _registration_lock:
+        # Re-check under the lock: a concurrent first caller may have
+        # finished registration while we were waiting.
+        if _components_registered:
+            return
+        _register_builtin_components()
+        _components_registered = True
+
+
+def _register_builtin_components() -> None:
+    """Register all builtin components. Must be called under _registration_lock."""
     logger.info("Registering builtin components...")
 
     # React component
@@ -165,7 +279,6 @@ def ensure_components_registered() -> None:
     component_registry.register(ResearchSupervisorComponent())
     component_registry.register(FinalReportComponent())
 
-    _components_registered = True
     logger.info(f"Registered {len(component_registry.list_all())} components")
 
 
@@ -9,6 +9,7 @@ as "component" nodes.
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from collections.abc import Callable
 from enum import StrEnum
 from typing import TYPE_CHECKING, Any
 
@@ -76,6 +77,10 @@ class ExecutableComponent(ABC):
                 ...
     """
 
+    # Components are long-lived singletons whose only per-instance state is
+    # the compiled overrides validator; slots drop the instance __dict__.
+    __slots__ = ("_overrides_validator", "_export_config_cache")
+
     @property
     @abstractmethod
     def metadata(self) -> ComponentMetadata:
@@ -132,9 +137,14 @@ class ExecutableComponent(ABC):
         Export component as JSON-serializable configuration.
 
         Returns a canonical component node config that can be used in
-        GraphConfig to reference this component.
+        GraphConfig to reference this component. The export is derived from
+        immutable metadata, so it is built once per instance and the cached
+        dict is returned on subsequent calls; treat it as read-only.
         """
-        return {
+        cached = getattr(self, "_export_config_cache", None)
+        if cached is not None:
+            return cached
+        config = self._export_config_cache = {
             "kind": "component",
             "config": {
                 "component_ref": {
@@ -149,55 +159,75 @@ class ExecutableComponent(ABC):
                 "required_capabilities": self.metadata.required_capabilities,
             },
         }
+        return config
 
-    def validate_config_overrides(self, config_overrides: dict[str, Any] | None) -> dict[str, Any]:
+    def _compile_overrides_validator(self) -> "Callable[[dict[str, Any] | None], dict[str, Any]]":
         """
-        Validate runtime config_overrides against the component contract.
+        Precompile the config_overrides contract into a closure.
 
-        Contract order:
-        1) If config_schema (Pydantic) is defined, use strict model validation.
-        2) Else if metadata.config_schema_json exists, enforce required/allowed keys.
-        3) Else accept raw overrides.
+        metadata and config_schema are immutable after registration, so the
+        required/allowed key sets are derived once here instead of being
+        re-interpreted from config_schema_json on every validation call.
         """
-        raw = config_overrides or {}
-        if not isinstance(raw, dict):
-            raise ValueError(
-                f"Component '{self.metadata.key}' config_overrides must be an object, got {type(raw).__name__}."
-            )
-
+        key = self.metadata.key
         schema_model = self.config_schema
-        if schema_model is not None:
-            try:
-                validated = schema_model.model_validate(raw)
-            except ValidationError as exc:
-                raise ValueError(f"Invalid config_overrides for component '{self.metadata.key}': {exc}") from exc
-            return validated.model_dump(exclude_none=True)
-
         schema_json = self.metadata.config_schema_json
-        if not isinstance(schema_json, dict):
-            return raw
 
-        required_raw = schema_json.get("required", [])
-        required_keys = [k for k in required_raw if isinstance(k, str)] if isinstance(required_raw, list) else []
-        missing_required = [k for k in required_keys if k not in raw]
-        if missing_required:
-            raise ValueError(
-                f"Invalid config_overrides for component '{self.metadata.key}': missing required keys "
-                f"{sorted(missing_required)}."
-            )
-
-        properties = schema_json.get("properties", {})
-        allow_additional = bool(schema_json.get("additionalProperties", False))
-        if isinstance(properties, dict) and not allow_additional:
-            allowed = {k for k in properties if isinstance(k, str)}
-            unknown = sorted([k for k in raw if k not in allowed])
-            if unknown:
+        required_keys: frozenset[str] = frozenset()
+        allowed: frozenset[str] | None = None
+        if schema_model is None and isinstance(schema_json, dict):
+            required_raw = schema_json.get("required", [])
+            if isinstance(required_raw, list):
+                required_keys = frozenset(k for k in required_raw if isinstance(k, str))
+            properties = schema_json.get("properties", {})
+            allow_additional = bool(schema_json.get("additionalProperties", False))
+            if isinstance(properties, dict) and not allow_additional:
+                allowed = frozenset(k for k in properties if isinstance(k, str))
+
+        def _validate(config_overrides: dict[str, Any] | None) -> dict[str, Any]:
+            raw = config_overrides or {}
+            if not isinstance(raw, dict):
+                raise ValueError(f"Component '{key}' config_overrides must be an object, got {type(raw).__name__}.")
+
+            if schema_model is not None:
+                try:
+                    validated = schema_model.model_validate(raw)
+                except ValidationError as exc:
+                    raise ValueError(f"Invalid config_overrides for component '{key}': {exc}") from exc
+                return validated.model_dump(exclude_none=True)
+
+            # C-level set differences instead of Python-loop comprehensions.
+            missing_required = required_keys - raw.keys()
+            if missing_required:
                 raise ValueError(
-                    f"Invalid config_overrides for component '{self.metadata.key}': unknown keys {unknown}. "
-                    f"Allowed keys: {sorted(allowed)}."
+                    f"Invalid config_overrides for component '{key}': missing required keys {sorted(missing_required)}."
                 )
 
-        return raw
+            if allowed is not None:
+                unknown = sorted(raw.keys() - allowed)
+                if unknown:
+                    raise ValueError(
+                        f"Invalid config_overrides for component '{key}': unknown keys {unknown}. "
+                        f"Allowed keys: {sorted(allowed)}."
+                    )
+
+            return raw
+
+        return _validate
+
+    def validate_config_overrides(self, config_overrides: dict[str, Any] | None) -> dict[str, Any]:
+        """
+        Validate runtime config_overrides against the component contract.
+
+        Contract order:
+        1) If config_schema (Pydantic) is defined, use strict model validation.
+        2) Else if metadata.config_schema_json exists, enforce required/allowed keys.
+        3) Else accept raw overrides.
+        """
+        validator = getattr(self, "_overrides_validator", None)
+        if validator is None:
+            validator = self._overrides_validator = self._compile_overrides_validator()
+        return validator(config_overrides)
 
     def validate(self) -> list[str]:
         """Validate component configuration. Returns list of errors (empty if valid)."""
@@ -115,6 +115,8 @@ class ClarifyWithUserComponent(ExecutableComponent):
     No tools required - pure LLM reasoning.
     """
 
+    __slots__ = ()
+
     @property
     def metadata(self) -> ComponentMetadata:
         return ComponentMetadata(
@@ -238,6 +240,8 @@ class ResearchBriefComponent(ExecutableComponent):
     No tools required - pure LLM generation.
     """
 
+    __slots__ = ()
+
     @property
     def metadata(self) -> ComponentMetadata:
         return ComponentMetadata(
@@ -351,6 +355,8 @@ class ResearchSupervisorComponent(ExecutableComponent):
     Required capabilities: research, think
     """
 
+    __slots__ = ()
+
     @property
     def metadata(self) -> ComponentMetadata:
         return ComponentMetadata(
@@ -582,6 +588,8 @@ class FinalReportComponent(ExecutableComponent):
     No tools required - pure LLM synthesis.
     """
 
+    __slots__ = ()
+
     @property
     def metadata(self) -> ComponentMetadata:
         return ComponentMetadata(
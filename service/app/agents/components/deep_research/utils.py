@@ -2,19 +2,66 @@
 
 from __future__ import annotations
 
-from datetime import datetime
+from collections.abc import Callable
+from datetime import date, datetime
+from typing import Any
 
 from langchain_core.messages import BaseMessage, MessageLikeRepresentation
 
 
+# Formatted date cached per calendar day; the value only changes at midnight
+# but this is called for every prompt build. Assignment is atomic in CPython,
+# so a race at worst recomputes the same string.
+_today_cache: tuple[date, str] | None = None
+
+
 def get_today_str() -> str:
     """Get current date formatted for display in prompts and outputs.
 
     Returns:
         Human-readable date string in format like 'Mon Jan 15, 2024'
     """
+    global _today_cache
     now = datetime.now()
-    return f"{now:%a} {now:%b} {now.day}, {now:%Y}"
+    today = now.date()
+    cached = _today_cache
+    if cached is not None and cached[0] == today:
+        return cached[1]
+    formatted = f"{now:%a} {now:%b} {now.day}, {now:%Y}"
+    _today_cache = (today, formatted)
+    return formatted
+
+
+# Exact-type dispatch for the plain message representations; BaseMessage
+# subclasses are handled by the isinstance fallback in get_buffer_string.
+_MESSAGE_HANDLERS: dict[type, Callable[[Any], tuple[str, str]]] = {
+    str: lambda m: ("unknown", m),
+    tuple: lambda m: (str(m[0]), str(m[1])) if len(m) == 2 else ("unknown", str(m)),
+    dict: lambda m: (str(m.get("type", m.get("role", "unknown"))), str(m.get("content", m))),
+}
+
+
+def _format_message(
+    msg: Any,
+    # Default-arg bindings keep the hot loop free of global lookups.
+    _handlers: dict[type, Callable[[Any], tuple[str, str]]] = _MESSAGE_HANDLERS,
+    _isinstance: Callable[..., bool] = isinstance,
+    _base_message: type[BaseMessage] = BaseMessage,
+    _str: type[str] = str,
+) -> str:
+    """Format a single message as 'role: content'."""
+    handler = _handlers.get(type(msg))
+    if handler is not None:
+        role, content = handler(msg)
+    # Handle actual message objects (most common case)
+    elif _isinstance(msg, _base_message):
+        role = msg.type
+        content = msg.content if _isinstance(msg.content, _str) else _str(msg.content)
+    # Handle list and other types
+    else:
+        role = "unknown"
+        content = _str(msg)
+    return f"{role}: {content}"
 
 
 def get_buffer_string(messages: list[MessageLikeRepresentation]) -> str:
@@ -26,32 +73,7 @@ def get_buffer_string(messages: list[MessageLikeRepresentation]) -> str:
     Returns:
         Formatted string representation of messages
     """
-    buffer_parts: list[str] = []
-    for msg in messages:
-        # Handle actual message objects (most common case)
-        if isinstance(msg, BaseMessage):
-            role = msg.type
-            content = msg.content if isinstance(msg.content, str) else str(msg.content)
-        # Handle string messages
-        elif isinstance(msg, str):
-            role = "unknown"
-            content = msg
-        # Handle tuple messages (role, content)
-        elif isinstance(msg, tuple) and len(msg) == 2:
-            role = str(msg[0])
-            content = str(msg[1])
-        # Handle dict messages
-        elif isinstance(msg, dict):
-            role = str(msg.get("type", msg.get("role", "unknown")))
-            content = str(msg.get("content", msg))
-        # Handle list and other types
-        else:
-            role = "unknown"
-            content = str(msg)
-
-        buffer_parts.append(f"{role}: {content}")
-
-    return "\n".join(buffer_parts)
+    return "\n".join(map(_format_message, messages))
 
 
 __all__ = [
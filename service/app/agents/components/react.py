@@ -64,6 +64,8 @@ class ReActComponent(ExecutableComponent):
     }
     """
 
+    __slots__ = ()
+
     @property
     def metadata(self) -> ComponentMetadata:
         return ComponentMetadata(
@@ -27,11 +27,10 @@ from __future__ import annotations
 import logging
 from typing import TYPE_CHECKING, Any
 
-from langgraph.graph.state import CompiledStateGraph
 from langgraph.store.base import BaseStore
 from sqlmodel.ext.asyncio.session import AsyncSession
 
-from app.agents.types import DynamicCompiledGraph, LLMFactory
+from app.agents.types import LazyCompiledGraph, LLMFactory
 from app.core.chat.agent_event_handler import AgentEventContext
 
 if TYPE_CHECKING:
@@ -52,6 +51,96 @@ logger = logging.getLogger(__name__)
 # Default builtin agent key when no agent is specified
 DEFAULT_BUILTIN_AGENT = "react"
 
+# Parsed + canonicalized + validated GraphConfig per raw-config digest.
+# The compiled LangGraph itself cannot be cached across requests (it binds
+# per-request llm factories, DB-bound tools, stores and checkpointers), but
+# the pure pydantic parse/canonicalize/validate stage can. LRU via dict
+# insertion order: hits are re-inserted, eviction pops the oldest entry.
+_CANONICAL_CONFIG_CACHE: dict[str, Any] = {}
+_CANONICAL_CONFIG_CACHE_MAX = 256
+
+
+def _config_digest(raw_config: dict[str, Any]) -> str:
+    """Stable content digest for a raw config dict."""
+    import hashlib
+    import json
+
+    return hashlib.blake2b(
+        json.dumps(raw_config, sort_keys=True, default=str).encode(),
+        digest_size=16,
+    ).hexdigest()
+
+
+def _canonical_config_for(raw_config: dict[str, Any]) -> Any:
+    """Parse, canonicalize and validate a raw config, memoized by content digest."""
+    from app.agents.graph.canonicalizer import parse_and_canonicalize_graph_config
+    from app.agents.graph.validator import ensure_valid_graph_config
+
+    digest = _config_digest(raw_config)
+
+    cached = _CANONICAL_CONFIG_CACHE.pop(digest, None)
+    if cached is not None:
+        _CANONICAL_CONFIG_CACHE[digest] = cached
+        return cached
+
+    graph_config = parse_and_canonicalize_graph_config(raw_config)
+    ensure_valid_graph_config(graph_config)
+
+    _CANONICAL_CONFIG_CACHE[digest] = graph_config
+    while len(_CANONICAL_CONFIG_CACHE) > _CANONICAL_CONFIG_CACHE_MAX:
+        _CANONICAL_CONFIG_CACHE.pop(next(iter(_CANONICAL_CONFIG_CACHE)))
+    return graph_config
+
+
+# model_dump() output per builtin key. Builtins never change at runtime, so
+# the recursive pydantic dump runs once per key; callers get a shallow copy
+# and must treat nested subtrees as read-only (inject_system_prompt already
+# clones along its write paths).
+_BUILTIN_CONFIG_DICTS: dict[str, dict[str, Any]] = {}
+
+
+def _builtin_config_dict(key: str) -> dict[str, Any] | None:
+    """Return a builtin config as a dict, memoizing the model_dump per key."""
+    from app.agents.builtin import get_builtin_config
+
+    cached = _BUILTIN_CONFIG_DICTS.get(key)
+    if cached is None:
+        config = get_builtin_config(key)
+        if config is None:
+            return None
+        cached = _BUILTIN_CONFIG_DICTS[key] = config.model_dump()
+    return dict(cached)
+
+
+# Builtin keys never change after startup registration, so the set is
+# computed once and reused instead of rebuilding it per agent resolution.
+# Lowercase on purpose: the name is rebound on first use, and an uppercase
+# module global would trip reportConstantRedefinition.
+_builtin_keys_cache: frozenset[str] | None = None
+
+# Call-site latch for ensure_components_registered(); see build_graph_agent.
+# Lowercase for the same reason as _builtin_keys_cache above: the latch is
+# rebound after the first build.
+_components_ready = False
+
+# Injected config per (config digest, prompt digest). On multi-turn chats
+# the session prompt is stable, so repeat turns skip the clone + node walk
+# of inject_system_prompt. Entries are shared and must be treated as
+# read-only downstream (build_graph_agent only serializes them).
+_INJECTED_CONFIG_CACHE: dict[tuple[str, str], dict[str, Any]] = {}
+_INJECTED_CONFIG_CACHE_MAX = 256
+
+
+def _builtin_key_set() -> frozenset[str]:
+    """Return the set of builtin agent keys, computed lazily once."""
+    global _builtin_keys_cache
+
+    if _builtin_keys_cache is None:
+        from app.agents.builtin import list_builtin_keys
+
+        _builtin_keys_cache = frozenset(list_builtin_keys())
+    return _builtin_keys_cache
+
 
 async def create_chat_agent(
     db: AsyncSession,
@@ -65,7 +154,7 @@ async def create_chat_agent(
     checkpointer: "BaseCheckpointSaver | None" = None,
     prompt_layers: "SystemPromptLayers | None" = None,
     model_tier: str | None = None,
-) -> tuple[CompiledStateGraph[Any, None, Any, Any], AgentEventContext]:
+) -> tuple[LazyCompiledGraph, AgentEventContext]:
     """
     Create the appropriate agent for a chat session.
 
@@ -244,12 +333,10 @@ def _resolve_agent_config(
         - agent_type_key: Agent type for events (e.g., "react", "deep_research", "graph")
         - node_prompts: Original node-level prompts extracted before injection
     """
-    from app.agents.builtin import get_builtin_config, list_builtin_keys
-
     if agent_config and agent_config.graph_config:
         # Agent has a graph_config - use it as the source of truth
         raw_config = agent_config.graph_config
-        builtin_keys = set(list_builtin_keys())
+        builtin_keys = _builtin_key_set()
         ui = raw_config.get("ui")
 
         # Extract agent type key for analytics/UI, but DON'T replace the config.
@@ -279,12 +366,10 @@ def _resolve_agent_config(
         return raw_config, agent_type_key, node_prompts
 
     # No agent config or no graph_config - use default builtin (react)
-    builtin_config = get_builtin_config(DEFAULT_BUILTIN_AGENT)
-    if not builtin_config:
+    config_dict = _builtin_config_dict(DEFAULT_BUILTIN_AGENT)
+    if config_dict is None:
         raise ValueError(f"Default builtin agent '{DEFAULT_BUILTIN_AGENT}' not found")
 
-    config_dict = builtin_config.model_dump()
-
     # Extract original node prompts BEFORE inject_system_prompt() overwrites them
     node_prompts = _extract_node_prompts(config_dict)
 
@@ -371,6 +456,59 @@ def _extract_node_prompts(config_dict: dict[str, Any]) -> dict[str, str]:
     return prompts
 
 
+def _clone_for_prompt_injection(config_dict: dict[str, Any]) -> tuple[dict[str, Any], list[Any]]:
+    """Shallow-clone a config along the node-list write path.
+
+    Returns the cloned config plus its (cloned) node list. Only the
+    containers on the path to the nodes are duplicated; every other subtree
+    still aliases the original config, which is treated as read-only.
+    """
+    config = dict(config_dict)
+    node_list = config.get("nodes")
+    if isinstance(node_list, list):
+        nodes = list(node_list)
+        config["nodes"] = nodes
+        return config, nodes
+    graph = config.get("graph")
+    if isinstance(graph, dict):
+        candidate = graph.get("nodes")
+        if isinstance(candidate, list):
+            graph = dict(graph)
+            nodes = list(candidate)
+            graph["nodes"] = nodes
+            config["graph"] = graph
+            return config, nodes
+    return config, []
+
+
+_NODE_PROMPT_OPEN = "\n\n<NODE_PROMPT>\n"
+_NODE_PROMPT_CLOSE = "\n</NODE_PROMPT>"
+
+
+def _merge_layered_prompt(base_prompt: str, node_prompt: Any) -> str:
+    """Layer a node-level prompt under the base system prompt."""
+    base = base_prompt.strip()
+    node = node_prompt.strip() if isinstance(node_prompt, str) else ""
+    if base and node:
+        # join over f-string: one allocation for the four parts instead of
+        # repeated resizes on long prompts.
+        return "".join((base, _NODE_PROMPT_OPEN, node, _NODE_PROMPT_CLOSE))
+    if base:
+        return base
+    return node
+
+
+# (discriminator field, value) -> (node config key, is_component).
+# v2 nodes discriminate on "type" with per-kind config keys; canonical nodes
+# discriminate on "kind" and keep everything under "config".
+_PROMPT_INJECTION_DISPATCH: dict[tuple[str, str], tuple[str, bool]] = {
+    ("type", "component"): ("component_config", True),
+    ("type", "llm"): ("llm_config", False),
+    ("kind", "component"): ("config", True),
+    ("kind", "llm"): ("config", False),
+}
+
+
 def inject_system_prompt(config_dict: dict[str, Any], system_prompt: str) -> dict[str, Any]:
     """
     Inject system_prompt into a graph config.
@@ -382,6 +520,9 @@ def inject_system_prompt(config_dict: dict[str, Any], system_prompt: str) -> dic
     This injects into ALL matching nodes (not just the first), ensuring
     forked agents with multiple components all receive the custom prompt.
 
+    The input config is never mutated; instead of deep-copying the whole
+    tree, only the dicts along each write path are cloned.
+
     Args:
         config_dict: GraphConfig as dict
         system_prompt: System prompt to inject
@@ -389,70 +530,71 @@ def inject_system_prompt(config_dict: dict[str, Any], system_prompt: str) -> dic
     Returns:
         Modified config dict with system_prompt injected
     """
-    import copy
-
-    def merge_layered_prompt(base_prompt: str, node_prompt: Any) -> str:
-        base = base_prompt.strip()
-        node = node_prompt.strip() if isinstance(node_prompt, str) else ""
-        if base and node:
-            return f"{base}\n\n<NODE_PROMPT>\n{node}\n</NODE_PROMPT>"
-        if base:
-            return base
-        return node
-
-    config = copy.deepcopy(config_dict)
+    # Fast path: a blank prompt has nothing to layer, so skip the clone and
+    # node walk entirely (callers already guard, this keeps it contractual).
+    if not system_prompt.strip():
+        return config_dict
+
+    # Injection is pure in (config, prompt); memoize it so repeat turns with
+    # a stable session prompt skip the clone + node walk. LRU via dict
+    # insertion order, mirroring _CANONICAL_CONFIG_CACHE.
+    import hashlib
+
+    cache_key = (_config_digest(config_dict), hashlib.blake2b(system_prompt.encode(), digest_size=16).hexdigest())
+    cached = _INJECTED_CONFIG_CACHE.pop(cache_key, None)
+    if cached is not None:
+        _INJECTED_CONFIG_CACHE[cache_key] = cached
+        return cached
+
+    merge_layered_prompt = _merge_layered_prompt
+    dispatch = _PROMPT_INJECTION_DISPATCH
+    config, nodes = _clone_for_prompt_injection(config_dict)
     merged_llm_nodes = 0
     merged_component_nodes = 0
     llm_nodes_with_node_prompt = 0
     component_nodes_with_node_prompt = 0
 
-    for node in _get_node_list(config):
+    for index, node in enumerate(nodes):
         if not isinstance(node, dict):
             continue
 
-        # v2 shape
-        if node.get("type") == "component":
-            comp_config = node.setdefault("component_config", {})
-            if isinstance(comp_config, dict):
-                overrides = comp_config.setdefault("config_overrides", {})
-                if isinstance(overrides, dict):
-                    existing_component_prompt = overrides.get("system_prompt")
-                    if isinstance(existing_component_prompt, str) and existing_component_prompt.strip():
-                        component_nodes_with_node_prompt += 1
-                    overrides["system_prompt"] = merge_layered_prompt(system_prompt, existing_component_prompt)
-                    merged_component_nodes += 1
-            continue
-        if node.get("type") == "llm":
-            llm_config = node.setdefault("llm_config", {})
-            if isinstance(llm_config, dict):
-                existing_prompt = llm_config.get("prompt_template")
-                if isinstance(existing_prompt, str) and existing_prompt.strip():
-                    llm_nodes_with_node_prompt += 1
-                llm_config["prompt_template"] = merge_layered_prompt(system_prompt, existing_prompt)
-                merged_llm_nodes += 1
+        discriminator = "type" if "type" in node else "kind"
+        value = node.get(discriminator)
+        entry = dispatch.get((discriminator, value)) if isinstance(value, str) else None
+        if entry is None:
             continue
+        config_key, is_component = entry
 
-        # canonical shape
-        if node.get("kind") == "component":
-            comp_config = node.setdefault("config", {})
-            if isinstance(comp_config, dict):
-                overrides = comp_config.setdefault("config_overrides", {})
-                if isinstance(overrides, dict):
-                    existing_component_prompt = overrides.get("system_prompt")
-                    if isinstance(existing_component_prompt, str) and existing_component_prompt.strip():
-                        component_nodes_with_node_prompt += 1
-                    overrides["system_prompt"] = merge_layered_prompt(system_prompt, existing_component_prompt)
-                    merged_component_nodes += 1
-            continue
-        if node.get("kind") == "llm":
-            llm_config = node.setdefault("config", {})
-            if isinstance(llm_config, dict):
-                existing_prompt = llm_config.get("prompt_template")
-                if isinstance(existing_prompt, str) and existing_prompt.strip():
-                    llm_nodes_with_node_prompt += 1
-                llm_config["prompt_template"] = merge_layered_prompt(system_prompt, existing_prompt)
-                merged_llm_nodes += 1
+        node_config = node.get(config_key)
+        if node_config is None:
+            node_config = {}
+        if not isinstance(node_config, dict):
             continue
+        node_config = dict(node_config)
+
+        if is_component:
+            overrides = node_config.get("config_overrides")
+            if overrides is None:
+                overrides = {}
+            if not isinstance(overrides, dict):
+                continue
+            overrides = dict(overrides)
+            existing_component_prompt = overrides.get("system_prompt")
+            if isinstance(existing_component_prompt, str) and existing_component_prompt.strip():
+                component_nodes_with_node_prompt += 1
+            overrides["system_prompt"] = merge_layered_prompt(system_prompt, existing_component_prompt)
+            node_config["config_overrides"] = overrides
+            merged_component_nodes += 1
+        else:
+            existing_prompt = node_config.get("prompt_template")
+            if isinstance(existing_prompt, str) and existing_prompt.strip():
+                llm_nodes_with_node_prompt += 1
+            node_config["prompt_template"] = merge_layered_prompt(system_prompt, existing_prompt)
+            merged_llm_nodes += 1
+
+        node = dict(node)
+        node[config_key] = node_config
+        nodes[index] = node
 
     logger.info(
         "Prompt layering injected: llm_nodes=%d (with_node_prompt=%d), component_nodes=%d (with_node_prompt=%d)",
@@ -462,6 +604,9 @@ def inject_system_prompt(config_dict: dict[str, Any], system_prompt: str) -> dic
         component_nodes_with_node_prompt,
     )
 
+    _INJECTED_CONFIG_CACHE[cache_key] = config
+    while len(_INJECTED_CONFIG_CACHE) > _INJECTED_CONFIG_CACHE_MAX:
+        _INJECTED_CONFIG_CACHE.pop(next(iter(_INJECTED_CONFIG_CACHE)))
     return config
 
 
@@ -474,7 +619,7 @@ async def build_graph_agent(
     checkpointer: "BaseCheckpointSaver | None" = None,
     prompt_layers: "SystemPromptLayers | None" = None,
     node_prompts: dict[str, str] | None = None,
-) -> tuple[DynamicCompiledGraph, dict[str, str]]:
+) -> tuple[LazyCompiledGraph, dict[str, str]]:
     """
     Build a graph agent from a canonical configuration.
 
@@ -489,19 +634,22 @@ async def build_graph_agent(
     Returns:
         Tuple of (CompiledStateGraph, node_component_keys)
     """
-    from app.agents.components import ensure_components_registered
-    from app.agents.graph.canonicalizer import parse_and_canonicalize_graph_config
     from app.agents.graph.compiler import GraphCompiler
-    from app.agents.graph.validator import ensure_valid_graph_config
 
-    # Ensure components are registered before building
-    ensure_components_registered()
+    # Ensure components are registered before building. Registration is
+    # one-shot and unregistration is not supported, so after the first build
+    # this skips the cross-module call and lock check entirely.
+    global _components_ready
+    if not _components_ready:
+        from app.agents.components import ensure_components_registered
+
+        ensure_components_registered()
+        _components_ready = True
 
     # Build tool registry
     tool_registry = {t.name: t for t in tools}
 
-    graph_config = parse_and_canonicalize_graph_config(raw_config)
-    ensure_valid_graph_config(graph_config)
+    graph_config = _canonical_config_for(raw_config)
 
     compiler = GraphCompiler(
         config=graph_config,
@@ -512,10 +660,12 @@ async def build_graph_agent(
         prompt_layers=prompt_layers,
         node_prompts=node_prompts,
     )
-    compiled_graph = await compiler.build()
+    # node_component_keys only needs the static config walk; the LangGraph
+    # Pregel construction is deferred until the graph is first streamed.
+    compiled_graph = LazyCompiledGraph(compiler.build)
     node_component_keys = compiler.get_node_component_keys()
     logger.info(
-        "Built graph agent (schema=%s, key=%s) with %d nodes",
+        "Prepared graph agent (schema=%s, key=%s) with %d nodes",
         graph_config.schema_version,
         graph_config.key,
         len(graph_config.graph.nodes),
@@ -530,7 +680,7 @@ async def create_agent_from_builtin(
     model_name: str | None,
     tools: list["BaseTool"] | None = None,
     system_prompt: str = "",
-) -> tuple[CompiledStateGraph[Any, None, Any, Any], AgentEventContext] | None:
+) -> tuple[LazyCompiledGraph, AgentEventContext] | None:
     """
     Create an agent directly from a builtin config.
 
@@ -572,7 +722,7 @@ async def create_agent_from_builtin(
         )
 
     # Get config and inject system prompt if needed
-    config_dict = config.model_dump()
+    config_dict = _builtin_config_dict(builtin_key) or config.model_dump()
     if system_prompt:
         config_dict = inject_system_prompt(config_dict, system_prompt)
 
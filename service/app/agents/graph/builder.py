@@ -165,6 +165,9 @@ class GraphBuilder:
         self.config = config
         self.llm_factory = llm_factory
         self.tool_registry = tool_registry
+        # Materialized once; node builders repeatedly need "all tools" and
+        # re-listing the registry values per node adds up on large graphs.
+        self._all_tools = list(tool_registry.values())
         self.context = context or {}
         self._store = store
         self._checkpointer = checkpointer
@@ -185,7 +188,7 @@ class GraphBuilder:
         # Build ToolNode if we have tools
         self._tool_node = None
         if tool_registry:
-            tools = list(tool_registry.values())
+            tools = self._all_tools
             # Apply global tool filter if configured
             if config.tool_config and config.tool_config.tool_filter:
                 from app.tools.capabilities import TOOL_FILTER_EXEMPT
@@ -340,7 +343,7 @@ class GraphBuilder:
         if structured_model:
             configured_llm = base_llm.with_structured_output(structured_model)
         elif llm_config.tools_enabled and self.tool_registry:
-            tools_to_bind = list(self.tool_registry.values())
+            tools_to_bind = self._all_tools
             if llm_config.tool_filter:
                 from app.tools.capabilities import TOOL_FILTER_EXEMPT
 
@@ -599,10 +602,10 @@ class GraphBuilder:
         """
         from app.tools.capabilities import filter_tools_by_capabilities, get_tool_capabilities
 
-        all_tools = list(self.tool_registry.values())
+        all_tools = self._all_tools
 
         if not required_capabilities:
-            return all_tools
+            return list(all_tools)
 
         filtered = filter_tools_by_capabilities(all_tools, required_capabilities)
 
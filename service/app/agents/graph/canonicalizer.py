@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import json
 from typing import Any
 
 from app.schemas.graph_config import (
@@ -14,6 +13,22 @@ from app.schemas.graph_config import (
 )
 
 
+def _canonical_value(value: Any) -> Any:
+    """Convert a predicate value into a cheap, deterministic, orderable form.
+
+    Dicts become sorted tuples of pairs and lists become tuples so Python's
+    C-level tuple comparison can order them; this replaces a per-edge
+    json.dumps that dominated the edge-sort cost on predicate-heavy graphs.
+    """
+    if isinstance(value, dict):
+        return tuple((k, _canonical_value(v)) for k, v in sorted(value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_canonical_value(v) for v in value)
+    if isinstance(value, (str, int, float, bool)) or value is None:
+        return value
+    return repr(value)
+
+
 def _edge_when_sort_key(when: BuiltinEdgeCondition | EdgePredicate | None) -> tuple[str, str, str, str]:
     if when is None:
         return ("0", "", "", "")
@@ -25,7 +40,7 @@ def _edge_when_sort_key(when: BuiltinEdgeCondition | EdgePredicate | None) -> tu
         "2",
         when.state_path,
         when.operator.value,
-        json.dumps(when.value, sort_keys=True, default=str),
+        repr(_canonical_value(when.value)),
     )
 
 
@@ -45,34 +60,38 @@ def _edge_sort_key(edge: GraphEdgeConfig) -> tuple[str, int, str, str, str, str,
 def canonicalize_graph_config(config: GraphConfig) -> GraphConfig:
     """Return a deterministic canonical form for a valid GraphConfig."""
 
-    nodes = sorted(config.graph.nodes, key=lambda node: node.id)
-    edges = sorted(config.graph.edges, key=_edge_sort_key)
-    entrypoints = sorted(config.graph.entrypoints)
+    if config._canonical:
+        # Already canonicalized; re-sorting and re-copying every node/edge
+        # would produce an identical model.
+        return config
 
-    canonical_graph = config.graph.model_copy(
-        update={
-            "nodes": nodes,
-            "edges": edges,
-            "entrypoints": entrypoints,
-        }
-    )
+    # Decorate-sort-undecorate: compute each sort key exactly once instead of
+    # letting sorted(key=...) re-wrap the key function per comparison setup.
+    decorated_nodes = [(node.id, index, node) for index, node in enumerate(config.graph.nodes)]
+    decorated_nodes.sort()
+    nodes = [node for _, _, node in decorated_nodes]
 
-    # Normalize optional sections into deterministic JSON shape.
-    normalized_deps: Any = None
-    if config.deps is not None:
-        normalized_deps = config.deps.model_validate(config.deps.model_dump())
-
-    normalized_metadata: Any = None
-    if config.metadata is not None:
-        normalized_metadata = config.metadata.model_validate(config.metadata.model_dump())
-
-    return config.model_copy(
-        update={
-            "graph": canonical_graph,
-            "deps": normalized_deps,
-            "metadata": normalized_metadata,
-        }
-    )
+    decorated_edges = [(_edge_sort_key(edge), index, edge) for index, edge in enumerate(config.graph.edges)]
+    decorated_edges.sort()
+    edges = [edge for _, _, edge in decorated_edges]
+
+    entrypoints = sorted(config.graph.entrypoints)
+
+    # The sorted collections hold the same already-validated models, so the
+    # rebuilt graph/config are assembled with model_construct: no validator
+    # dispatch, just field assignment. deps/metadata likewise arrive as
+    # validated instances from parse_graph_config and are reused as-is.
+    graph_fields: dict[str, Any] = {
+        **config.graph.__dict__,
+        "nodes": nodes,
+        "edges": edges,
+        "entrypoints": entrypoints,
+    }
+    canonical_graph = type(config.graph).model_construct(**graph_fields)
+    config_fields: dict[str, Any] = {**config.__dict__, "graph": canonical_graph}
+    canonical = type(config).model_construct(**config_fields)
+    canonical._canonical = True
+    return canonical
 
 
 def parse_and_canonicalize_graph_config(raw_config: dict[str, Any]) -> GraphConfig:
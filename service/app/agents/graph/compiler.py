@@ -53,6 +53,17 @@ _PREDICATE_OPERATOR_MAP: dict[PredicateOperator, ConditionOperator] = {
     PredicateOperator.FALSY: ConditionOperator.FALSY,
 }
 
+_BUILTIN_EDGE_CONDITION_MAP: dict[BuiltinEdgeCondition, ConditionType] = {
+    BuiltinEdgeCondition.HAS_TOOL_CALLS: ConditionType.HAS_TOOL_CALLS,
+    BuiltinEdgeCondition.NO_TOOL_CALLS: ConditionType.NO_TOOL_CALLS,
+}
+
+# Canonical state reducer -> legacy reducer; anything unmapped (including a
+# missing reducers entry) falls back to REPLACE.
+_REDUCER_MAP: dict[StateReducerType | None, ReducerType] = {
+    StateReducerType.ADD_MESSAGES: ReducerType.ADD_MESSAGES,
+}
+
 
 class GraphCompiler:
     """Compile graph config to executable LangGraph."""
@@ -67,12 +78,27 @@ class GraphCompiler:
         prompt_layers: "SystemPromptLayers | None" = None,
         node_prompts: dict[str, str] | None = None,
     ) -> None:
-        canonical = canonicalize_graph_config(config)
-        ensure_valid_graph_config(canonical)
+        # Configs arriving from the factory are already canonicalized and
+        # validated (see _canonical_config_for); redoing both here would
+        # deep-copy every node/edge a second time per build. Callers passing
+        # a pre-canonicalized config are responsible for having validated it.
+        if config._canonical:
+            canonical = config
+        else:
+            canonical = canonicalize_graph_config(config)
+            ensure_valid_graph_config(canonical)
 
         self.config = canonical
+        # Canonical configs are shared across builds through the factory's
+        # digest cache; the legacy bridge form is pure in the config, so it is
+        # derived on first use and stashed on the instance. This fuses away
+        # the repeat node/edge traversal on multi-turn chats.
+        legacy = canonical._legacy_bridge
+        if legacy is None:
+            legacy = self._to_legacy_graph_config(canonical)
+            canonical._legacy_bridge = legacy
         self._builder = GraphBuilder(
-            config=self._to_legacy_graph_config(canonical),
+            config=legacy,
             llm_factory=llm_factory,
             tool_registry=tool_registry,
             store=store,
@@ -127,94 +153,30 @@ class GraphCompiler:
         )
 
     def _to_legacy_state_fields(self, config: GraphConfig) -> dict[str, LegacyStateFieldSchema]:
-        result: dict[str, LegacyStateFieldSchema] = {}
-        for field_name, field_schema in config.state.state_schema.items():
-            reducer = config.state.reducers.get(field_name, StateReducerType.REPLACE)
-            legacy_reducer = (
-                ReducerType.ADD_MESSAGES if reducer == StateReducerType.ADD_MESSAGES else ReducerType.REPLACE
-            )
-            result[field_name] = LegacyStateFieldSchema(
+        reducers = config.state.reducers
+        return {
+            field_name: LegacyStateFieldSchema(
                 type=field_schema.type.value,
                 description=field_schema.description,
                 default=field_schema.default,
-                reducer=legacy_reducer,
+                reducer=_REDUCER_MAP.get(reducers.get(field_name), ReducerType.REPLACE),
             )
-        return result
+            for field_name, field_schema in config.state.state_schema.items()
+        }
 
     def _to_legacy_node(self, node: GraphNodeConfig) -> LegacyGraphNodeConfig:
-        if isinstance(node, LLMGraphNode):
-            return LegacyGraphNodeConfig(
-                id=node.id,
-                name=node.name,
-                type=NodeType.LLM,
-                description=node.description,
-                llm_config=LegacyLLMNodeConfig(
-                    prompt_template=node.config.prompt_template,
-                    output_key=node.config.output_key,
-                    model_override=node.config.model_override,
-                    temperature_override=node.config.temperature_override,
-                    max_tokens=node.config.max_tokens,
-                    tools_enabled=node.config.tools_enabled,
-                    tool_filter=node.config.tool_filter,
-                    max_iterations=node.config.max_iterations,
-                    message_key=node.config.message_key,
-                ),
-            )
-
-        if isinstance(node, ToolGraphNode):
-            return LegacyGraphNodeConfig(
-                id=node.id,
-                name=node.name,
-                type=NodeType.TOOL,
-                description=node.description,
-                tool_config=LegacyToolNodeConfig(
-                    execute_all=node.config.execute_all,
-                    tool_filter=node.config.tool_filter,
-                    output_key=node.config.output_key,
-                    timeout_seconds=node.config.timeout_seconds,
-                ),
-            )
-
-        if isinstance(node, TransformGraphNode):
-            return LegacyGraphNodeConfig(
-                id=node.id,
-                name=node.name,
-                type=NodeType.TRANSFORM,
-                description=node.description,
-                transform_config=LegacyTransformNodeConfig(
-                    template=node.config.template,
-                    output_key=node.config.output_key,
-                    input_keys=node.config.input_keys,
-                ),
-            )
-
-        component_node = node
-        if not isinstance(component_node, ComponentGraphNode):
-            raise ValueError(f"Unsupported node type in compiler: {type(node).__name__}")
-
-        return LegacyGraphNodeConfig(
-            id=component_node.id,
-            name=component_node.name,
-            type=NodeType.COMPONENT,
-            description=component_node.description,
-            component_config=LegacyComponentNodeConfig(
-                component_ref=LegacyComponentReference(
-                    key=component_node.config.component_ref.key,
-                    version=component_node.config.component_ref.version,
-                ),
-                config_overrides=component_node.config.config_overrides,
-            ),
-        )
+        try:
+            builder = _LEGACY_NODE_BUILDERS[type(node)]
+        except KeyError:
+            raise ValueError(f"Unsupported node type in compiler: {type(node).__name__}") from None
+        return builder(node)
 
     def _to_legacy_edge(self, edge: GraphEdgeConfig) -> LegacyGraphEdgeConfig:
         condition: ConditionType | CustomCondition | None = None
         if edge.when is None:
             condition = None
         elif isinstance(edge.when, BuiltinEdgeCondition):
-            if edge.when == BuiltinEdgeCondition.HAS_TOOL_CALLS:
-                condition = ConditionType.HAS_TOOL_CALLS
-            else:
-                condition = ConditionType.NO_TOOL_CALLS
+            condition = _BUILTIN_EDGE_CONDITION_MAP[edge.when]
         else:
             predicate = edge.when
             if not isinstance(predicate, EdgePredicate):
@@ -233,3 +195,78 @@ class GraphCompiler:
             label=edge.label,
             priority=edge.priority,
         )
+
+
+def _build_legacy_llm_node(node: LLMGraphNode) -> LegacyGraphNodeConfig:
+    return LegacyGraphNodeConfig(
+        id=node.id,
+        name=node.name,
+        type=NodeType.LLM,
+        description=node.description,
+        llm_config=LegacyLLMNodeConfig(
+            prompt_template=node.config.prompt_template,
+            output_key=node.config.output_key,
+            model_override=node.config.model_override,
+            temperature_override=node.config.temperature_override,
+            max_tokens=node.config.max_tokens,
+            tools_enabled=node.config.tools_enabled,
+            tool_filter=node.config.tool_filter,
+            max_iterations=node.config.max_iterations,
+            message_key=node.config.message_key,
+        ),
+    )
+
+
+def _build_legacy_tool_node(node: ToolGraphNode) -> LegacyGraphNodeConfig:
+    return LegacyGraphNodeConfig(
+        id=node.id,
+        name=node.name,
+        type=NodeType.TOOL,
+        description=node.description,
+        tool_config=LegacyToolNodeConfig(
+            execute_all=node.config.execute_all,
+            tool_filter=node.config.tool_filter,
+            output_key=node.config.output_key,
+            timeout_seconds=node.config.timeout_seconds,
+        ),
+    )
+
+
+def _build_legacy_transform_node(node: TransformGraphNode) -> LegacyGraphNodeConfig:
+    return LegacyGraphNodeConfig(
+        id=node.id,
+        name=node.name,
+        type=NodeType.TRANSFORM,
+        description=node.description,
+        transform_config=LegacyTransformNodeConfig(
+            template=node.config.template,
+            output_key=node.config.output_key,
+            input_keys=node.config.input_keys,
+        ),
+    )
+
+
+def _build_legacy_component_node(node: ComponentGraphNode) -> LegacyGraphNodeConfig:
+    return LegacyGraphNodeConfig(
+        id=node.id,
+        name=node.name,
+        type=NodeType.COMPONENT,
+        description=node.description,
+        component_config=LegacyComponentNodeConfig(
+            component_ref=LegacyComponentReference(
+                key=node.config.component_ref.key,
+                version=node.config.component_ref.version,
+            ),
+            config_overrides=node.config.config_overrides,
+        ),
+    )
+
+
+# Exact-type dispatch: one dict hit per node instead of an isinstance chain.
+# Node models are final in practice, so subclass lookup is not a concern.
+_LEGACY_NODE_BUILDERS: dict[type, Any] = {
+    LLMGraphNode: _build_legacy_llm_node,
+    ToolGraphNode: _build_legacy_tool_node,
+    TransformGraphNode: _build_legacy_transform_node,
+    ComponentGraphNode: _build_legacy_component_node,
+}
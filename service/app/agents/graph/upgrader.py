@@ -2,26 +2,55 @@
 
 from __future__ import annotations
 
+import json
+import os
+import sys
+import threading
 from dataclasses import dataclass
-from typing import Any
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, TypedDict, cast
+
+if TYPE_CHECKING:
+    from app.schemas.graph_config import GraphConfig
+    from app.schemas.graph_config_legacy import (
+        GraphConfig as LegacyGraphConfig,
+        GraphEdgeConfig as LegacyGraphEdgeConfig,
+        GraphNodeConfig as LegacyGraphNodeConfig,
+    )
+
+# The schema/canonicalizer/validator stack builds sizeable pydantic models at
+# import time, so it is imported inside the functions that actually upgrade
+# payloads. Version detection and the cache probes stay import-light.
+
+# Opt-in fast path: skip pydantic re-validation of the migrated v3 payload.
+# The payload is produced by _convert_v2_to_v3_raw from an already-validated
+# v2 model, so ensure_valid_graph_config remains the correctness gate.
+_SKIP_MIGRATED_VALIDATION = os.getenv("XYZEN_SKIP_MIGRATED_VALIDATION", "").lower() in ("1", "true", "yes")
+
+# Opt-in: drop migration warnings entirely for callers that never consume
+# them (e.g. background precompilation), skipping warning construction and
+# message formatting altogether.
+_SUPPRESS_MIGRATION_WARNINGS = os.getenv("XYZEN_SUPPRESS_MIGRATION_WARNINGS", "").lower() in ("1", "true", "yes")
+
+
+class V3NodeDict(TypedDict, total=False):
+    """Sparse v3 node payload produced by conversion.
 
-from pydantic import ValidationError
+    None-valued optional fields are omitted rather than set explicitly, so
+    downstream pydantic validation short-circuits to field defaults instead
+    of coercing each None individually.
+    """
 
-from app.agents.graph.canonicalizer import canonicalize_graph_config
-from app.agents.graph.validator import ensure_valid_graph_config
-from app.schemas.graph_config_legacy import (
-    ConditionType,
-    GraphConfig as LegacyGraphConfig,
-    GraphEdgeConfig as LegacyGraphEdgeConfig,
-    GraphNodeConfig as LegacyGraphNodeConfig,
-    NodeType,
-    create_react_config,
-    migrate_graph_config,
-)
-from app.schemas.graph_config import GraphConfig, parse_graph_config
+    id: str
+    kind: str
+    name: str
+    description: str | None
+    reads: list[str]
+    writes: list[str]
+    config: dict[str, Any]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class GraphConfigMigrationWarning:
     """Non-fatal migration detail."""
 
@@ -30,13 +59,36 @@ class GraphConfigMigrationWarning:
     message: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class GraphConfigMigrationResult:
     """Structured migration output."""
 
     source_version: str
     config: GraphConfig
-    warnings: list[GraphConfigMigrationWarning]
+    # Tuple, not list: results are shared via the upgrade cache, and tuple
+    # concatenation when prepending the default-config warning avoids a
+    # list copy per call.
+    warnings: tuple[GraphConfigMigrationWarning, ...]
+
+
+def _emit_warning(
+    warnings: list[GraphConfigMigrationWarning],
+    code: str,
+    path: str,
+    message: str,
+    *args: Any,
+) -> None:
+    """Append a migration warning, deferring %-formatting to emission time.
+
+    No-ops when XYZEN_SUPPRESS_MIGRATION_WARNINGS is set, so suppressed
+    migrations never pay for warning construction or message formatting.
+    """
+
+    if _SUPPRESS_MIGRATION_WARNINGS:
+        return
+    if args:
+        message = message % args
+    warnings.append(GraphConfigMigrationWarning(code=code, path=path, message=message))
 
 
 class GraphConfigMigrationError(ValueError):
@@ -49,6 +101,28 @@ class GraphConfigMigrationError(ValueError):
         self.message = message
 
 
+def _freeze_payload(raw_config: dict[str, Any]) -> str | None:
+    """Serialize a raw payload into a stable cache key, or None if it cannot be."""
+    try:
+        return json.dumps(raw_config, sort_keys=True, default=str)
+    except (TypeError, ValueError):
+        return None
+
+
+@lru_cache(maxsize=512)
+def _parse_v3_cached(frozen_json: str) -> GraphConfig:
+    from app.schemas.graph_config import parse_graph_config
+
+    return parse_graph_config(json.loads(frozen_json))
+
+
+@lru_cache(maxsize=512)
+def _validate_legacy_cached(frozen_json: str) -> LegacyGraphConfig:
+    from app.schemas.graph_config_legacy import GraphConfig as LegacyGraphConfig
+
+    return LegacyGraphConfig.model_validate(json.loads(frozen_json))
+
+
 def detect_graph_config_version(raw_config: dict[str, Any]) -> str:
     """Detect graph config version from raw payload."""
 
@@ -58,15 +132,89 @@ def detect_graph_config_version(raw_config: dict[str, Any]) -> str:
     return str(raw_config.get("version", "1.0"))
 
 
+def _peek_raw(raw_config: dict[str, Any]) -> tuple[str, bool]:
+    """Single pass over the top-level payload: (version, explicitly-empty)."""
+
+    schema_version = raw_config.get("schema_version")
+    version = str(schema_version) if schema_version else str(raw_config.get("version", "1.0"))
+
+    # v1/v2 keep nodes at the top level; v3 nests them under "graph".
+    raw_nodes = raw_config.get("nodes")
+    empty = isinstance(raw_nodes, list) and not raw_nodes
+    if not empty:
+        graph = raw_config.get("graph")
+        if isinstance(graph, dict):
+            graph_nodes = graph.get("nodes")
+            empty = isinstance(graph_nodes, list) and not graph_nodes
+    return version, empty
+
+
+# Successful upgrades per payload content; graph configs are immutable for a
+# given key/revision, so hot-reload and warmup paths short-circuit the whole
+# parse/migrate/canonicalize/validate pipeline. LRU via dict insertion order.
+_UPGRADE_CACHE: dict[str, tuple[str, GraphConfig, tuple[GraphConfigMigrationWarning, ...]]] = {}
+_UPGRADE_CACHE_MAX = 256
+_UPGRADE_CACHE_LOCK = threading.Lock()
+
+
 def upgrade_graph_config(raw_config: dict[str, Any]) -> GraphConfigMigrationResult:
     """Upgrade a raw graph config payload to canonical form."""
 
-    source_version = detect_graph_config_version(raw_config)
+    frozen = _freeze_payload(raw_config)
+    if frozen is not None:
+        with _UPGRADE_CACHE_LOCK:
+            cached = _UPGRADE_CACHE.pop(frozen, None)
+            if cached is not None:
+                _UPGRADE_CACHE[frozen] = cached
+                source_version, config, warnings = cached
+                return GraphConfigMigrationResult(
+                    source_version=source_version,
+                    config=config,
+                    warnings=warnings,
+                )
+
+    result = _upgrade_graph_config_uncached(raw_config, frozen)
+
+    if frozen is not None:
+        with _UPGRADE_CACHE_LOCK:
+            _UPGRADE_CACHE[frozen] = (result.source_version, result.config, result.warnings)
+            while len(_UPGRADE_CACHE) > _UPGRADE_CACHE_MAX:
+                _UPGRADE_CACHE.pop(next(iter(_UPGRADE_CACHE)))
+    return result
+
+
+def _classify_version(source_version: str) -> int:
+    """Classify a version string by major prefix: 3, 2, 1, or 0 for unknown.
+
+    A single two-character slice compare replaces the chain of startswith
+    probes the upgrade pipeline would otherwise run on every payload.
+    """
+
+    prefix = source_version[:2]
+    if prefix == "3.":
+        return 3
+    if prefix == "2.":
+        return 2
+    if prefix == "1.":
+        return 1
+    return 0
+
+
+def _upgrade_graph_config_uncached(raw_config: dict[str, Any], frozen: str | None) -> GraphConfigMigrationResult:
+    from pydantic import ValidationError
+
+    from app.agents.graph.canonicalizer import canonicalize_graph_config
+    from app.agents.graph.validator import ensure_valid_graph_config
+    from app.schemas.graph_config import parse_graph_config
+    from app.schemas.graph_config_legacy import GraphConfig as LegacyGraphConfig, migrate_graph_config
+
+    source_version, is_empty = _peek_raw(raw_config)
+    version_kind = _classify_version(source_version)
     warnings: list[GraphConfigMigrationWarning] = []
 
-    if source_version.startswith("3."):
+    if version_kind == 3:
         try:
-            parsed = parse_graph_config(raw_config)
+            parsed = _parse_v3_cached(frozen) if frozen is not None else parse_graph_config(raw_config)
             canonical = canonicalize_graph_config(parsed)
             ensure_valid_graph_config(canonical)
         except (ValidationError, ValueError) as exc:
@@ -78,19 +226,21 @@ def upgrade_graph_config(raw_config: dict[str, Any]) -> GraphConfigMigrationResu
         return GraphConfigMigrationResult(
             source_version=source_version,
             config=canonical,
-            warnings=warnings,
+            warnings=tuple(warnings),
         )
 
-    if _is_explicit_empty_graph(raw_config):
+    if is_empty:
         raise GraphConfigMigrationError(
             code="EMPTY_GRAPH",
             path="graph_config.nodes",
             message="Empty graph cannot be auto-migrated.",
         )
 
-    if source_version.startswith("2."):
+    if version_kind == 2:
         try:
-            config_v2 = LegacyGraphConfig.model_validate(raw_config)
+            config_v2 = (
+                _validate_legacy_cached(frozen) if frozen is not None else LegacyGraphConfig.model_validate(raw_config)
+            )
         except ValidationError as exc:
             raise GraphConfigMigrationError(
                 code="INVALID_V2_CONFIG",
@@ -98,13 +248,13 @@ def upgrade_graph_config(raw_config: dict[str, Any]) -> GraphConfigMigrationResu
                 message=str(exc),
             ) from exc
     else:
-        if not source_version.startswith("1."):
-            warnings.append(
-                GraphConfigMigrationWarning(
-                    code="UNKNOWN_VERSION_TREATED_AS_V1",
-                    path="graph_config.version",
-                    message=f"Unknown version '{source_version}' treated as v1 payload.",
-                )
+        if version_kind != 1:
+            _emit_warning(
+                warnings,
+                "UNKNOWN_VERSION_TREATED_AS_V1",
+                "graph_config.version",
+                "Unknown version '%s' treated as v1 payload.",
+                source_version,
             )
         try:
             config_v2 = migrate_graph_config(raw_config)
@@ -114,12 +264,11 @@ def upgrade_graph_config(raw_config: dict[str, Any]) -> GraphConfigMigrationResu
                 path="graph_config",
                 message=str(exc),
             ) from exc
-        warnings.append(
-            GraphConfigMigrationWarning(
-                code="UPGRADED_V1_TO_V2",
-                path="graph_config.version",
-                message="Migrated through legacy v1->v2 transformer before conversion.",
-            )
+        _emit_warning(
+            warnings,
+            "UPGRADED_V1_TO_V2",
+            "graph_config.version",
+            "Migrated through legacy v1->v2 transformer before conversion.",
         )
 
     config_v3_raw = _convert_v2_to_v3_raw(
@@ -128,7 +277,9 @@ def upgrade_graph_config(raw_config: dict[str, Any]) -> GraphConfigMigrationResu
         warnings=warnings,
     )
     try:
-        parsed_v3 = parse_graph_config(config_v3_raw)
+        parsed_v3 = (
+            _construct_migrated_v3(config_v3_raw) if _SKIP_MIGRATED_VALIDATION else parse_graph_config(config_v3_raw)
+        )
         canonical_v3 = canonicalize_graph_config(parsed_v3)
         ensure_valid_graph_config(canonical_v3)
     except (ValidationError, ValueError) as exc:
@@ -141,10 +292,22 @@ def upgrade_graph_config(raw_config: dict[str, Any]) -> GraphConfigMigrationResu
     return GraphConfigMigrationResult(
         source_version=source_version,
         config=canonical_v3,
-        warnings=warnings,
+        warnings=tuple(warnings),
     )
 
 
+@lru_cache(maxsize=64)
+def _default_v2_payload(prompt: str) -> dict[str, Any]:
+    """Synthesize and dump the default ReAct v2 config once per prompt.
+
+    The returned dict is shared across calls; upgrade_graph_config only
+    reads and serializes it.
+    """
+    from app.schemas.graph_config_legacy import create_react_config
+
+    return create_react_config(prompt=prompt).model_dump()
+
+
 def upgrade_or_create_default_graph_config(
     raw_config: dict[str, Any] | None,
     *,
@@ -154,7 +317,7 @@ def upgrade_or_create_default_graph_config(
 
     if raw_config is None:
         prompt = agent_prompt or "You are a helpful assistant."
-        default_v2 = create_react_config(prompt=prompt).model_dump()
+        default_v2 = _default_v2_payload(prompt)
         result = upgrade_graph_config(default_v2)
         default_warning = GraphConfigMigrationWarning(
             code="DEFAULT_GRAPH_FROM_NULL",
@@ -164,24 +327,190 @@ def upgrade_or_create_default_graph_config(
         return GraphConfigMigrationResult(
             source_version="null",
             config=result.config,
-            warnings=[default_warning, *result.warnings],
+            warnings=(default_warning, *result.warnings),
         )
 
     return upgrade_graph_config(raw_config)
 
 
-def _is_explicit_empty_graph(raw_config: dict[str, Any]) -> bool:
-    # v1/v2 shape
-    raw_nodes = raw_config.get("nodes")
-    if isinstance(raw_nodes, list) and not raw_nodes:
-        return True
-    # v3-like nested shape
-    graph = raw_config.get("graph")
-    if isinstance(graph, dict):
-        graph_nodes = graph.get("nodes")
-        if isinstance(graph_nodes, list) and not graph_nodes:
-            return True
-    return False
+def upgrade_graph_configs_bulk(
+    raw_configs: list[dict[str, Any]],
+    *,
+    max_workers: int | None = None,
+) -> list[GraphConfigMigrationResult]:
+    """Upgrade many raw graph config payloads concurrently.
+
+    Runs upgrade_graph_config across a thread pool for batch paths
+    (warmup, bulk imports) where payloads are independent. Results are
+    returned in input order; a failing payload raises its
+    GraphConfigMigrationError when its slot is collected, so earlier
+    successes are still computed (and cached) before the error surfaces.
+    """
+
+    if not raw_configs:
+        return []
+    if len(raw_configs) == 1:
+        return [upgrade_graph_config(raw_configs[0])]
+
+    from concurrent.futures import ThreadPoolExecutor
+
+    workers = max_workers or min(32, len(raw_configs))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(upgrade_graph_config, raw_configs))
+
+
+# Interned fixed vocabulary used across every converted node/edge payload:
+# downstream dict probes and pydantic discriminator dispatch compare against
+# cached-hash pointers instead of re-hashing fresh literals.
+_KIND_LLM = sys.intern("llm")
+_KIND_TOOL = sys.intern("tool")
+_KIND_TRANSFORM = sys.intern("transform")
+_KIND_COMPONENT = sys.intern("component")
+_KEY_MESSAGES = sys.intern("messages")
+_END = sys.intern("END")
+
+# Fixed legacy condition -> v3 "when" string; custom predicates fall through
+# to _build_custom_when. Keyed by plain strings: legacy ConditionType is a
+# StrEnum, so members hash and compare as their values and the table needs
+# no import of the legacy schema.
+_WHEN_MAP: dict[str, str] = {
+    "has_tool_calls": "has_tool_calls",
+    "no_tool_calls": "no_tool_calls",
+}
+
+# kind -> (node model, config model); populated on first construct-path use.
+_MIGRATED_NODE_TYPES: dict[str, tuple[type, type]] = {}
+
+
+def _construct_migrated_v3(payload: dict[str, Any]) -> GraphConfig:
+    """Assemble a GraphConfig from a migrated payload without re-validation.
+
+    Only safe for payloads produced by _convert_v2_to_v3_raw: all values were
+    sourced from an already-validated LegacyGraphConfig, so the recursive
+    pydantic walk would only re-prove what the v2 validation established.
+    Structural invariants are still enforced by ensure_valid_graph_config.
+    """
+    from app.schemas.graph_config import (
+        BuiltinEdgeCondition,
+        ComponentGraphNode,
+        ComponentNodeConfig,
+        ComponentReference,
+        EdgePredicate,
+        GraphConfig,
+        GraphDeps,
+        GraphEdgeConfig,
+        GraphExecutionLimits,
+        GraphIR,
+        GraphMetadata,
+        GraphNodeKind,
+        GraphStateConfig,
+        LLMGraphNode,
+        LLMNodeConfig,
+        PredicateOperator,
+        StateFieldSchema,
+        StateFieldType,
+        StateReducerType,
+        ToolGraphNode,
+        ToolNodeConfig,
+        TransformGraphNode,
+        TransformNodeConfig,
+    )
+    from app.schemas.prompt_config import PromptConfig
+
+    if not _MIGRATED_NODE_TYPES:
+        _MIGRATED_NODE_TYPES.update(
+            {
+                "llm": (LLMGraphNode, LLMNodeConfig),
+                "tool": (ToolGraphNode, ToolNodeConfig),
+                "transform": (TransformGraphNode, TransformNodeConfig),
+                "component": (ComponentGraphNode, ComponentNodeConfig),
+            }
+        )
+
+    graph_raw = payload["graph"]
+
+    nodes = []
+    for node_raw in graph_raw["nodes"]:
+        kind = node_raw["kind"]
+        node_model, config_model = _MIGRATED_NODE_TYPES[kind]
+        config = node_raw["config"]
+        if kind == "component":
+            config = ComponentNodeConfig.model_construct(
+                component_ref=ComponentReference.model_construct(**config["component_ref"]),
+                config_overrides=config["config_overrides"],
+            )
+        else:
+            config = config_model.model_construct(**config)
+        nodes.append(
+            node_model.model_construct(
+                id=node_raw["id"],
+                kind=GraphNodeKind(kind),
+                name=node_raw["name"],
+                description=node_raw.get("description"),
+                reads=node_raw.get("reads", []),
+                writes=node_raw.get("writes", []),
+                config=config,
+            )
+        )
+
+    edges = []
+    for edge_raw in graph_raw["edges"]:
+        when_raw = edge_raw.get("when")
+        when: BuiltinEdgeCondition | EdgePredicate | None
+        if when_raw is None:
+            when = None
+        elif isinstance(when_raw, str):
+            when = BuiltinEdgeCondition(when_raw)
+        else:
+            when = EdgePredicate.model_construct(
+                state_path=when_raw["state_path"],
+                operator=PredicateOperator(when_raw["operator"]),
+                value=when_raw.get("value"),
+            )
+        edges.append(
+            GraphEdgeConfig.model_construct(
+                from_node=edge_raw["from_node"],
+                to_node=edge_raw["to_node"],
+                when=when,
+                priority=edge_raw.get("priority", 0),
+                label=edge_raw.get("label"),
+            )
+        )
+
+    state_raw = payload["state"]
+    state = GraphStateConfig.model_construct(
+        state_schema={
+            name: StateFieldSchema.model_construct(
+                type=StateFieldType(field["type"]),
+                description=field.get("description"),
+                default=field.get("default"),
+            )
+            for name, field in state_raw["schema"].items()
+        },
+        reducers={name: StateReducerType(value) for name, value in state_raw["reducers"].items()},
+    )
+
+    deps_raw = payload.get("deps")
+    metadata_raw = payload.get("metadata")
+    prompt_raw = payload.get("prompt_config")
+
+    return GraphConfig.model_construct(
+        schema_version="3.0",
+        key=payload["key"],
+        revision=payload["revision"],
+        graph=GraphIR.model_construct(
+            nodes=nodes,
+            edges=edges,
+            entrypoints=graph_raw["entrypoints"],
+        ),
+        state=state,
+        limits=GraphExecutionLimits.model_construct(**payload["limits"]),
+        # Leaf sections are tiny; plain validation keeps their coercion rules.
+        deps=GraphDeps.model_validate(deps_raw) if deps_raw else None,
+        metadata=GraphMetadata.model_validate(metadata_raw) if metadata_raw else None,
+        prompt_config=PromptConfig.model_validate(prompt_raw) if prompt_raw else None,
+        ui=payload.get("ui"),
+    )
 
 
 def _convert_v2_to_v3_raw(
@@ -190,18 +519,38 @@ def _convert_v2_to_v3_raw(
     warnings: list[GraphConfigMigrationWarning],
 ) -> dict[str, Any]:
     node_ids: set[str] = set()
-    v3_nodes: list[dict[str, Any]] = []
+    v3_nodes: list[V3NodeDict] = []
+    # Collected in the same pass as node conversion so deps/ui extraction
+    # below doesn't re-walk the node list. Plain dicts act as ordered sets:
+    # O(1) dedup with insertion order preserved.
+    model_keys: dict[str, None] = {}
+    component_refs: dict[tuple[str, str], None] = {}
+    positions: dict[str, dict[str, float]] = {}
 
     for index, node in enumerate(config_v2.nodes):
+        if node.llm_config and node.llm_config.model_override:
+            model_keys[node.llm_config.model_override] = None
+        if node.component_config:
+            component_refs[(node.component_config.component_ref.key, node.component_config.component_ref.version)] = (
+                None
+            )
+        if isinstance(node.position, dict):
+            x = node.position.get("x")
+            y = node.position.get("y")
+            # Exact-type probes: dodge isinstance's MRO walk, (deliberately)
+            # reject bools, and still narrow for the type checker.
+            if (type(x) is int or type(x) is float) and (type(y) is int or type(y) is float):
+                positions[node.id] = {"x": float(x), "y": float(y)}
+
         node_id = (node.id or "").strip()
         if not node_id:
             node_id = f"node_{index + 1}"
-            warnings.append(
-                GraphConfigMigrationWarning(
-                    code="MISSING_NODE_ID_DEFAULTED",
-                    path=f"nodes[{index}].id",
-                    message=f"Node id missing; defaulted to '{node_id}'.",
-                )
+            _emit_warning(
+                warnings,
+                "MISSING_NODE_ID_DEFAULTED",
+                f"nodes[{index}].id",
+                "Node id missing; defaulted to '%s'.",
+                node_id,
             )
         if node_id in node_ids:
             raise GraphConfigMigrationError(
@@ -219,27 +568,32 @@ def _convert_v2_to_v3_raw(
             message="v2 graph has no executable nodes after conversion.",
         )
 
-    entrypoints = _derive_entrypoints(config_v2, node_ids, warnings)
-    v3_edges = _convert_v2_edges(config_v2.edges, node_ids, warnings)
+    # Interned ids get pointer-equality hash hits for the membership tests
+    # in entrypoint derivation and edge conversion below.
+    node_id_set = frozenset(sys.intern(node_id) for node_id in node_ids)
+    entrypoints = _derive_entrypoints(config_v2, node_id_set, warnings)
+    v3_edges = _convert_v2_edges(config_v2.edges, node_id_set, warnings)
 
     if not v3_edges:
-        warnings.append(
-            GraphConfigMigrationWarning(
-                code="NO_EDGES_DEFAULTED_TO_END",
-                path="edges",
-                message=f"No valid edges after conversion; added '{entrypoints[0]} -> END'.",
-            )
+        _emit_warning(
+            warnings,
+            "NO_EDGES_DEFAULTED_TO_END",
+            "edges",
+            "No valid edges after conversion; added '%s -> END'.",
+            entrypoints[0],
         )
-        v3_edges = [{"from_node": entrypoints[0], "to_node": "END"}]
+        v3_edges = [{"from_node": entrypoints[0], "to_node": _END}]
 
     metadata = _extract_metadata(config_v2)
     limits = _extract_limits(config_v2)
-    deps = _extract_deps(config_v2)
-    ui = _build_ui_payload(config_v2, source_version, warnings)
+    deps = _extract_deps(config_v2, model_keys, component_refs)
+    ui = _build_ui_payload(positions, source_version, warnings)
 
     key = _derive_key(config_v2)
     revision = _derive_revision(config_v2)
 
+    # Optional sections are added only when populated: pydantic skips an
+    # absent key faster than it processes an explicit None.
     payload: dict[str, Any] = {
         "schema_version": "3.0",
         "key": key,
@@ -251,115 +605,146 @@ def _convert_v2_to_v3_raw(
         },
         "state": _convert_state(config_v2),
         "limits": limits,
-        "prompt_config": config_v2.prompt_config.model_dump(exclude_none=True) if config_v2.prompt_config else None,
-        "metadata": metadata if metadata else None,
-        "deps": deps if deps else None,
-        "ui": ui if ui else None,
     }
+    if config_v2.prompt_config:
+        payload["prompt_config"] = config_v2.prompt_config.model_dump(exclude_none=True)
+    if metadata:
+        payload["metadata"] = metadata
+    if deps:
+        payload["deps"] = deps
+    if ui:
+        payload["ui"] = ui
     return payload
 
 
-def _convert_v2_node(
+def _sparse(**fields: Any) -> dict[str, Any]:
+    """Build a config dict omitting None-valued entries."""
+    return {key: value for key, value in fields.items() if value is not None}
+
+
+def _convert_v2_llm_node(
     node: LegacyGraphNodeConfig,
     node_id: str,
     index: int,
     warnings: list[GraphConfigMigrationWarning],
-) -> dict[str, Any]:
-    node_name = node.name or node_id
-
-    if node.type == NodeType.LLM:
-        llm = node.llm_config
-        if llm is None:
-            warnings.append(
-                GraphConfigMigrationWarning(
-                    code="MISSING_LLM_CONFIG_DEFAULTED",
-                    path=f"nodes[{index}].llm_config",
-                    message="LLM node missing llm_config; default runtime values were applied.",
-                )
-            )
-            config = {
-                "prompt_template": "",
-                "output_key": "response",
-                "tools_enabled": True,
-                "max_iterations": 200,
-            }
-        else:
-            config = {
-                "prompt_template": llm.prompt_template,
-                "output_key": llm.output_key,
-                "model_override": llm.model_override,
-                "temperature_override": llm.temperature_override,
-                "max_tokens": llm.max_tokens,
-                "tools_enabled": llm.tools_enabled,
-                "tool_filter": llm.tool_filter,
-                "max_iterations": llm.max_iterations,
-                "message_key": llm.message_key,
-            }
-        return {
-            "id": node_id,
-            "kind": "llm",
-            "name": node_name,
-            "description": node.description,
-            "reads": ["messages"],
-            "writes": ["messages", config["output_key"]],
-            "config": config,
+) -> V3NodeDict:
+    llm = node.llm_config
+    if llm is None:
+        _emit_warning(
+            warnings,
+            "MISSING_LLM_CONFIG_DEFAULTED",
+            f"nodes[{index}].llm_config",
+            "LLM node missing llm_config; default runtime values were applied.",
+        )
+        config = {
+            "prompt_template": "",
+            "output_key": "response",
+            "tools_enabled": True,
+            "max_iterations": 200,
         }
+    else:
+        config = _sparse(
+            prompt_template=llm.prompt_template,
+            output_key=llm.output_key,
+            model_override=llm.model_override,
+            temperature_override=llm.temperature_override,
+            max_tokens=llm.max_tokens,
+            tools_enabled=llm.tools_enabled,
+            tool_filter=llm.tool_filter,
+            max_iterations=llm.max_iterations,
+            message_key=llm.message_key,
+        )
+    return cast(
+        "V3NodeDict",
+        _sparse(
+            id=node_id,
+            kind=_KIND_LLM,
+            name=node.name or node_id,
+            description=node.description,
+            reads=[_KEY_MESSAGES],
+            writes=[_KEY_MESSAGES, config["output_key"]],
+            config=config,
+        ),
+    )
 
-    if node.type == NodeType.TOOL:
-        tool = node.tool_config
-        if tool is None:
-            warnings.append(
-                GraphConfigMigrationWarning(
-                    code="MISSING_TOOL_CONFIG_DEFAULTED",
-                    path=f"nodes[{index}].tool_config",
-                    message="Tool node missing tool_config; default runtime values were applied.",
-                )
-            )
-            config = {
-                "execute_all": True,
-                "tool_filter": None,
-                "output_key": "tool_results",
-                "timeout_seconds": 60,
-            }
-        else:
-            config = {
-                "execute_all": tool.execute_all,
-                "tool_filter": tool.tool_filter,
-                "output_key": tool.output_key,
-                "timeout_seconds": tool.timeout_seconds,
-            }
-        return {
-            "id": node_id,
-            "kind": "tool",
-            "name": node_name,
-            "description": node.description,
-            "reads": ["messages"],
-            "writes": [config["output_key"]],
-            "config": config,
+
+def _convert_v2_tool_node(
+    node: LegacyGraphNodeConfig,
+    node_id: str,
+    index: int,
+    warnings: list[GraphConfigMigrationWarning],
+) -> V3NodeDict:
+    tool = node.tool_config
+    if tool is None:
+        _emit_warning(
+            warnings,
+            "MISSING_TOOL_CONFIG_DEFAULTED",
+            f"nodes[{index}].tool_config",
+            "Tool node missing tool_config; default runtime values were applied.",
+        )
+        config = {
+            "execute_all": True,
+            "output_key": "tool_results",
+            "timeout_seconds": 60,
         }
+    else:
+        config = _sparse(
+            execute_all=tool.execute_all,
+            tool_filter=tool.tool_filter,
+            output_key=tool.output_key,
+            timeout_seconds=tool.timeout_seconds,
+        )
+    return cast(
+        "V3NodeDict",
+        _sparse(
+            id=node_id,
+            kind=_KIND_TOOL,
+            name=node.name or node_id,
+            description=node.description,
+            reads=[_KEY_MESSAGES],
+            writes=[config["output_key"]],
+            config=config,
+        ),
+    )
 
-    if node.type == NodeType.TRANSFORM:
-        transform = node.transform_config
-        if transform is None:
-            raise GraphConfigMigrationError(
-                code="MISSING_TRANSFORM_CONFIG",
-                path=f"nodes[{index}].transform_config",
-                message="Transform node missing transform_config.",
-            )
-        return {
-            "id": node_id,
-            "kind": "transform",
-            "name": node_name,
-            "description": node.description,
-            "reads": transform.input_keys,
-            "writes": [transform.output_key],
-            "config": {
+
+def _convert_v2_transform_node(
+    node: LegacyGraphNodeConfig,
+    node_id: str,
+    index: int,
+    warnings: list[GraphConfigMigrationWarning],
+) -> V3NodeDict:
+    transform = node.transform_config
+    if transform is None:
+        raise GraphConfigMigrationError(
+            code="MISSING_TRANSFORM_CONFIG",
+            path=f"nodes[{index}].transform_config",
+            message="Transform node missing transform_config.",
+        )
+    return cast(
+        "V3NodeDict",
+        _sparse(
+            id=node_id,
+            kind=_KIND_TRANSFORM,
+            name=node.name or node_id,
+            description=node.description,
+            reads=transform.input_keys,
+            writes=[transform.output_key],
+            config={
                 "template": transform.template,
                 "output_key": transform.output_key,
                 "input_keys": transform.input_keys,
             },
-        }
+        ),
+    )
+
 
+def _convert_v2_component_node(
+    node: LegacyGraphNodeConfig,
+    node_id: str,
+    index: int,
+    warnings: list[GraphConfigMigrationWarning],
+) -> V3NodeDict:
     component = node.component_config
     if component is None:
         raise GraphConfigMigrationError(
@@ -367,70 +752,99 @@ def _convert_v2_node(
             path=f"nodes[{index}].component_config",
             message="Component node missing component_config.",
         )
-    return {
-        "id": node_id,
-        "kind": "component",
-        "name": node_name,
-        "description": node.description,
-        "reads": [],
-        "writes": [],
-        "config": {
-            "component_ref": {
-                "key": component.component_ref.key,
-                "version": component.component_ref.version,
+    return cast(
+        "V3NodeDict",
+        _sparse(
+            id=node_id,
+            kind=_KIND_COMPONENT,
+            name=node.name or node_id,
+            description=node.description,
+            reads=[],
+            writes=[],
+            config={
+                "component_ref": {
+                    "key": component.component_ref.key,
+                    "version": component.component_ref.version,
+                },
+                "config_overrides": component.config_overrides,
             },
-            "config_overrides": component.config_overrides,
-        },
-    }
+        ),
+    )
+
+
+# Per-kind converters dispatched on node.type (a StrEnum, so it hashes as its
+# string value); each converter is straight-line attribute reads with no
+# cross-kind branching. Unknown types keep the historical component fallback.
+_V2_NODE_CONVERTERS: dict[str, Any] = {
+    _KIND_LLM: _convert_v2_llm_node,
+    _KIND_TOOL: _convert_v2_tool_node,
+    _KIND_TRANSFORM: _convert_v2_transform_node,
+    _KIND_COMPONENT: _convert_v2_component_node,
+}
+
+
+def _convert_v2_node(
+    node: LegacyGraphNodeConfig,
+    node_id: str,
+    index: int,
+    warnings: list[GraphConfigMigrationWarning],
+) -> V3NodeDict:
+    converter = _V2_NODE_CONVERTERS.get(node.type, _convert_v2_component_node)
+    return converter(node, node_id, index, warnings)
 
 
 def _derive_entrypoints(
     config_v2: LegacyGraphConfig,
-    node_ids: set[str],
+    node_ids: frozenset[str],
     warnings: list[GraphConfigMigrationWarning],
 ) -> list[str]:
     if config_v2.entry_point and config_v2.entry_point in node_ids:
         return [config_v2.entry_point]
 
     if config_v2.entry_point and config_v2.entry_point not in node_ids:
-        warnings.append(
-            GraphConfigMigrationWarning(
-                code="INVALID_ENTRYPOINT_FALLBACK",
-                path="entry_point",
-                message=f"entry_point '{config_v2.entry_point}' does not exist; deriving entrypoint from edges.",
-            )
+        _emit_warning(
+            warnings,
+            "INVALID_ENTRYPOINT_FALLBACK",
+            "entry_point",
+            "entry_point '%s' does not exist; deriving entrypoint from edges.",
+            config_v2.entry_point,
         )
 
+    # Set-based dedup with a list preserving first-seen order; the old
+    # "not in list" check was quadratic with many START edges.
+    seen_targets: set[str] = set()
     start_targets: list[str] = []
     for edge in config_v2.edges:
-        if edge.from_node == "START" and edge.to_node in node_ids and edge.to_node not in start_targets:
+        if edge.from_node == "START" and edge.to_node in node_ids and edge.to_node not in seen_targets:
+            seen_targets.add(edge.to_node)
             start_targets.append(edge.to_node)
 
     if start_targets:
         if len(start_targets) > 1:
-            warnings.append(
-                GraphConfigMigrationWarning(
-                    code="MULTIPLE_START_TARGETS_PICK_FIRST",
-                    path="edges",
-                    message=f"Multiple START targets found {start_targets}; selected '{start_targets[0]}'.",
-                )
+            _emit_warning(
+                warnings,
+                "MULTIPLE_START_TARGETS_PICK_FIRST",
+                "edges",
+                "Multiple START targets found %s; selected '%s'.",
+                start_targets,
+                start_targets[0],
             )
         return [start_targets[0]]
 
     default_entrypoint = config_v2.nodes[0].id
-    warnings.append(
-        GraphConfigMigrationWarning(
-            code="MISSING_ENTRYPOINT_FALLBACK",
-            path="entry_point",
-            message=f"No entrypoint found; defaulted to first node '{default_entrypoint}'.",
-        )
+    _emit_warning(
+        warnings,
+        "MISSING_ENTRYPOINT_FALLBACK",
+        "entry_point",
+        "No entrypoint found; defaulted to first node '%s'.",
+        default_entrypoint,
     )
     return [default_entrypoint]
 
 
 def _convert_v2_edges(
     edges: list[LegacyGraphEdgeConfig],
-    node_ids: set[str],
+    node_ids: frozenset[str],
     warnings: list[GraphConfigMigrationWarning],
 ) -> list[dict[str, Any]]:
     converted: list[dict[str, Any]] = []
@@ -439,65 +853,53 @@ def _convert_v2_edges(
             continue
 
         if edge.from_node == "END":
-            warnings.append(
-                GraphConfigMigrationWarning(
-                    code="EDGE_FROM_END_DROPPED",
-                    path=f"edges[{index}]",
-                    message="Dropped edge with END as source.",
-                )
+            _emit_warning(
+                warnings,
+                "EDGE_FROM_END_DROPPED",
+                f"edges[{index}]",
+                "Dropped edge with END as source.",
             )
             continue
 
         if edge.to_node == "START":
-            warnings.append(
-                GraphConfigMigrationWarning(
-                    code="EDGE_TO_START_DROPPED",
-                    path=f"edges[{index}]",
-                    message="Dropped edge with START as target.",
-                )
+            _emit_warning(
+                warnings,
+                "EDGE_TO_START_DROPPED",
+                f"edges[{index}]",
+                "Dropped edge with START as target.",
             )
             continue
 
         if edge.from_node not in node_ids:
-            warnings.append(
-                GraphConfigMigrationWarning(
-                    code="EDGE_SOURCE_MISSING_DROPPED",
-                    path=f"edges[{index}].from_node",
-                    message=f"Dropped edge from unknown node '{edge.from_node}'.",
-                )
+            _emit_warning(
+                warnings,
+                "EDGE_SOURCE_MISSING_DROPPED",
+                f"edges[{index}].from_node",
+                "Dropped edge from unknown node '%s'.",
+                edge.from_node,
             )
             continue
 
         if edge.to_node != "END" and edge.to_node not in node_ids:
-            warnings.append(
-                GraphConfigMigrationWarning(
-                    code="EDGE_TARGET_MISSING_DROPPED",
-                    path=f"edges[{index}].to_node",
-                    message=f"Dropped edge to unknown node '{edge.to_node}'.",
-                )
+            _emit_warning(
+                warnings,
+                "EDGE_TARGET_MISSING_DROPPED",
+                f"edges[{index}].to_node",
+                "Dropped edge to unknown node '%s'.",
+                edge.to_node,
             )
             continue
 
-        when: str | dict[str, Any] | None = None
-        if edge.condition is None:
+        condition = edge.condition
+        when: str | dict[str, Any] | None
+        if condition is None:
             when = None
-        elif edge.condition == ConditionType.HAS_TOOL_CALLS:
-            when = "has_tool_calls"
-        elif edge.condition == ConditionType.NO_TOOL_CALLS:
-            when = "no_tool_calls"
         else:
-            condition = edge.condition
-            if not condition.state_key:
-                raise GraphConfigMigrationError(
-                    code="MISSING_PREDICATE_STATE_KEY",
-                    path=f"edges[{index}].condition.state_key",
-                    message="Custom condition state_key is required for predicate migration.",
-                )
-            when = {
-                "state_path": condition.state_key,
-                "operator": condition.operator.value,
-                "value": condition.value,
-            }
+            # Legacy ConditionType is a StrEnum, so a str check covers it and
+            # excludes CustomCondition models.
+            when = _WHEN_MAP.get(condition) if isinstance(condition, str) else None
+            if when is None:
+                when = _build_custom_when(condition, index)
 
         converted.append(
             {
@@ -511,6 +913,20 @@ def _convert_v2_edges(
     return converted
 
 
+def _build_custom_when(condition: Any, index: int) -> dict[str, Any]:
+    if not condition.state_key:
+        raise GraphConfigMigrationError(
+            code="MISSING_PREDICATE_STATE_KEY",
+            path=f"edges[{index}].condition.state_key",
+            message="Custom condition state_key is required for predicate migration.",
+        )
+    return {
+        "state_path": condition.state_key,
+        "operator": condition.operator.value,
+        "value": condition.value,
+    }
+
+
 def _convert_state(config_v2: LegacyGraphConfig) -> dict[str, Any]:
     schema: dict[str, Any] = {}
     reducers: dict[str, str] = {}
@@ -526,8 +942,10 @@ def _convert_state(config_v2: LegacyGraphConfig) -> dict[str, Any]:
 
 def _extract_metadata(config_v2: LegacyGraphConfig) -> dict[str, Any]:
     raw = config_v2.metadata
-    tags_raw = raw.get("tags", [])
-    tags = [tag for tag in tags_raw if isinstance(tag, str)] if isinstance(tags_raw, list) else []
+    tags_raw = raw.get("tags")
+    # Exact-type probes: tags come from JSON, so literal str/list is the only
+    # shape that occurs and type() is skips isinstance's MRO walk per tag.
+    tags = [tag for tag in tags_raw if type(tag) is str] if type(tags_raw) is list else []
     metadata: dict[str, Any] = {
         "display_name": raw.get("display_name"),
         "description": raw.get("description"),
@@ -549,22 +967,19 @@ def _extract_limits(config_v2: LegacyGraphConfig) -> dict[str, Any]:
     }
 
 
-def _extract_deps(config_v2: LegacyGraphConfig) -> dict[str, Any]:
-    tools: list[str] = []
+def _extract_deps(
+    config_v2: LegacyGraphConfig,
+    model_keys: dict[str, None],
+    component_refs: dict[tuple[str, str], None],
+) -> dict[str, Any]:
+    tools: dict[str, None] = {}
     if config_v2.tool_config and config_v2.tool_config.tool_filter:
-        tools = [tool for tool in config_v2.tool_config.tool_filter if tool]
-
-    model_keys: set[str] = set()
-    component_refs: set[tuple[str, str]] = set()
-    for node in config_v2.nodes:
-        if node.llm_config and node.llm_config.model_override:
-            model_keys.add(node.llm_config.model_override)
-        if node.component_config:
-            component_refs.add((node.component_config.component_ref.key, node.component_config.component_ref.version))
+        tools = {tool: None for tool in config_v2.tool_config.tool_filter if tool}
 
+    # Output stays sorted so migrated configs remain byte-deterministic.
     deps: dict[str, Any] = {
         "models": [{"key": key} for key in sorted(model_keys)],
-        "tools": sorted(set(tools)),
+        "tools": sorted(tools),
         "prompts": [],
         "components": [{"key": key, "version": version} for key, version in sorted(component_refs)],
     }
@@ -574,18 +989,10 @@ def _extract_deps(config_v2: LegacyGraphConfig) -> dict[str, Any]:
 
 
 def _build_ui_payload(
-    config_v2: LegacyGraphConfig,
+    positions: dict[str, dict[str, float]],
     source_version: str,
     warnings: list[GraphConfigMigrationWarning],
 ) -> dict[str, Any]:
-    positions: dict[str, dict[str, float]] = {}
-    for node in config_v2.nodes:
-        if isinstance(node.position, dict):
-            x = node.position.get("x")
-            y = node.position.get("y")
-            if isinstance(x, (int, float)) and isinstance(y, (int, float)):
-                positions[node.id] = {"x": float(x), "y": float(y)}
-
     migration_payload = {
         "from_version": source_version,
         "warning_codes": [warning.code for warning in warnings],
@@ -626,5 +1033,6 @@ __all__ = [
     "GraphConfigMigrationWarning",
     "detect_graph_config_version",
     "upgrade_graph_config",
+    "upgrade_graph_configs_bulk",
     "upgrade_or_create_default_graph_config",
 ]
@@ -2,6 +2,10 @@
 
 from __future__ import annotations
 
+import threading
+from collections import Counter
+from functools import lru_cache
+from collections.abc import Set as AbstractSet
 from dataclasses import dataclass
 from typing import Iterable
 
@@ -12,7 +16,11 @@ from app.schemas.graph_config import (
     GraphEdgeConfig,
 )
 
-_BUILTIN_STATE_PATHS = {"messages", "execution_context"}
+_BUILTIN_STATE_PATHS: frozenset[str] = frozenset({"messages", "execution_context"})
+
+# Sentinel pseudo-nodes that may appear in edge endpoints but are never
+# real graph nodes; frozen at import so membership checks share one table.
+_SENTINEL_NODES: frozenset[str] = frozenset({"START", "END"})
 
 
 @dataclass(frozen=True)
@@ -24,82 +32,137 @@ class GraphConfigValidationError:
     message: str
 
 
-def _build_adjacency(edges: Iterable[GraphEdgeConfig], node_ids: set[str]) -> dict[str, set[str]]:
-    adjacency: dict[str, set[str]] = {node_id: set() for node_id in node_ids}
-    for edge in edges:
-        if edge.from_node in node_ids and edge.to_node in node_ids:
-            adjacency[edge.from_node].add(edge.to_node)
-    return adjacency
+@dataclass(slots=True)
+class _SourceRouting:
+    """Per-source routing tally filled during the main edge loop.
 
+    Records the first and second edge index per routing category (-1 while
+    unseen) so the determinism errors can be emitted after the loop without
+    re-walking any edge list.
+    """
 
-def _has_cycle(adjacency: dict[str, set[str]]) -> bool:
-    white = set(adjacency.keys())
-    gray: set[str] = set()
-    black: set[str] = set()
+    default_first: int = -1
+    default_second: int = -1
+    has_tool_first: int = -1
+    has_tool_second: int = -1
+    no_tool_first: int = -1
+    no_tool_second: int = -1
+    custom_first: int = -1
 
-    def visit(node: str) -> bool:
-        white.discard(node)
-        gray.add(node)
 
-        for nxt in adjacency.get(node, set()):
-            if nxt in black:
-                continue
-            if nxt in gray:
-                return True
-            if visit(nxt):
-                return True
-
-        gray.discard(node)
-        black.add(node)
-        return False
-
-    while white:
-        node = next(iter(white))
-        if visit(node):
-            return True
-    return False
-
-
-def _reachable_from_entrypoints(entrypoints: list[str], adjacency: dict[str, set[str]]) -> set[str]:
-    visited: set[str] = set()
-    queue = list(entrypoints)
-    while queue:
-        node = queue.pop(0)
-        if node in visited:
-            continue
-        visited.add(node)
-        for nxt in adjacency.get(node, set()):
-            if nxt not in visited:
-                queue.append(nxt)
-    return visited
-
-
-def _is_end_reachable(entrypoints: list[str], edges: list[GraphEdgeConfig]) -> bool:
-    visited_nodes: set[str] = set()
-    queue = list(entrypoints)
-
-    outgoing: dict[str, list[GraphEdgeConfig]] = {}
-    for edge in edges:
-        outgoing.setdefault(edge.from_node, []).append(edge)
+@lru_cache(maxsize=128)
+def _state_paths_for(schema_keys: frozenset[str]) -> frozenset[str]:
+    """Union of declared and built-in state paths, shared per schema shape."""
+    return schema_keys | _BUILTIN_STATE_PATHS
+
 
-    while queue:
-        node = queue.pop(0)
-        if node in visited_nodes:
-            continue
-        visited_nodes.add(node)
+_WHITE, _GRAY, _BLACK = 0, 1, 2
 
-        for edge in outgoing.get(node, []):
-            if edge.to_node == "END":
-                return True
-            if edge.to_node not in visited_nodes:
-                queue.append(edge.to_node)
 
-    return False
+def _sweep_graph(
+    entrypoints: list[str],
+    edges: Iterable[GraphEdgeConfig],
+    node_id_set: AbstractSet[str],
+) -> tuple[set[str], bool, bool]:
+    """Single iterative DFS over the edge list.
+
+    Returns (reachable, end_reachable, has_cycle): the nodes reachable from
+    the entrypoints, whether any entrypoint path reaches END, and whether
+    the graph contains a cycle. Fusing the three structural checks into one
+    coloring sweep walks the edges once instead of once per check.
+    """
+
+    outgoing: dict[str, list[str]] = {}
+    for edge in edges:
+        outgoing.setdefault(edge.from_node, []).append(edge.to_node)
+
+    empty: list[str] = []
+    color: dict[str, int] = {}
+    reachable: set[str] = set()
+    end_reached = False
+    has_cycle = False
+
+    # Phase 1 walks from the entrypoints, recording reachability and END
+    # edges; phase 2 sweeps the remaining components so cycles among
+    # unreachable nodes are still reported. Both phases share one coloring,
+    # so no node is expanded twice. A gray successor is a back-edge.
+    for from_entrypoints, seeds in ((True, entrypoints), (False, node_id_set)):
+        for seed in seeds:
+            if color.get(seed, _WHITE) != _WHITE:
+                continue
+            color[seed] = _GRAY
+            stack = [(seed, iter(outgoing.get(seed, empty)))]
+            while stack:
+                node, successors = stack[-1]
+                nxt = next(successors, None)
+                if nxt is None:
+                    color[node] = _BLACK
+                    stack.pop()
+                    continue
+                if nxt == "END":
+                    if from_entrypoints:
+                        end_reached = True
+                    continue
+                nxt_color = color.get(nxt, _WHITE)
+                if nxt_color == _GRAY:
+                    has_cycle = True
+                elif nxt_color == _WHITE:
+                    color[nxt] = _GRAY
+                    stack.append((nxt, iter(outgoing.get(nxt, empty))))
+        if from_entrypoints:
+            reachable = set(color)
+    return reachable, end_reached, has_cycle
+
+
+def _when_key(when: object) -> object:
+    """Hashable stand-in for an edge's when clause."""
+    if when is None or isinstance(when, BuiltinEdgeCondition):
+        return when
+    if isinstance(when, EdgePredicate):
+        return (when.state_path, when.operator, repr(when.value))
+    return repr(when)
+
+
+def _structural_key(config: GraphConfig) -> tuple[object, ...]:
+    """Hashable key over every input validate_graph_config reads."""
+    return (
+        tuple(node.id for node in config.graph.nodes),
+        tuple((edge.from_node, edge.to_node, _when_key(edge.when)) for edge in config.graph.edges),
+        tuple(config.graph.entrypoints),
+        frozenset(config.state.state_schema),
+        config.limits.max_steps,
+        config.limits.max_time_s,
+    )
+
+
+# Validation results per structural key; configs are re-validated on every
+# compile, so repeat shapes short-circuit the full sweep. LRU via dict
+# insertion order, locked because bulk upgrades validate from worker threads.
+_VALIDATION_CACHE: dict[tuple[object, ...], tuple[GraphConfigValidationError, ...]] = {}
+_VALIDATION_CACHE_MAX = 256
+_VALIDATION_CACHE_LOCK = threading.Lock()
 
 
 def validate_graph_config(config: GraphConfig) -> list[GraphConfigValidationError]:
     """Validate a GraphConfig and return structured errors."""
 
+    key = _structural_key(config)
+    with _VALIDATION_CACHE_LOCK:
+        cached = _VALIDATION_CACHE.pop(key, None)
+        if cached is not None:
+            _VALIDATION_CACHE[key] = cached
+            return list(cached)
+
+    errors = _validate_graph_config_uncached(config)
+
+    with _VALIDATION_CACHE_LOCK:
+        _VALIDATION_CACHE[key] = tuple(errors)
+        while len(_VALIDATION_CACHE) > _VALIDATION_CACHE_MAX:
+            _VALIDATION_CACHE.pop(next(iter(_VALIDATION_CACHE)))
+    return errors
+
+
+def _validate_graph_config_uncached(config: GraphConfig) -> list[GraphConfigValidationError]:
     errors: list[GraphConfigValidationError] = []
     nodes = config.graph.nodes
     edges = config.graph.edges
@@ -115,10 +178,12 @@ def validate_graph_config(config: GraphConfig) -> list[GraphConfigValidationErro
         )
         return errors
 
-    node_ids = [node.id for node in nodes]
-    node_id_set = set(node_ids)
+    # Counter gives the duplicate tally in one O(N) pass, and its key view
+    # doubles as the node-id set without building a second hash table.
+    node_id_counts = Counter(node.id for node in nodes)
+    node_id_set = node_id_counts.keys()
 
-    duplicate_ids = {node_id for node_id in node_ids if node_ids.count(node_id) > 1}
+    duplicate_ids = {node_id for node_id, count in node_id_counts.items() if count > 1}
     if duplicate_ids:
         errors.append(
             GraphConfigValidationError(
@@ -148,118 +213,137 @@ def validate_graph_config(config: GraphConfig) -> list[GraphConfigValidationErro
                 )
             )
 
-    state_paths = set(config.state.state_schema.keys()) | _BUILTIN_STATE_PATHS
+    state_paths = _state_paths_for(frozenset(config.state.state_schema))
 
-    edges_by_source: dict[str, list[tuple[int, GraphEdgeConfig]]] = {}
-    for idx, edge in enumerate(edges):
-        edge_path = f"graph.edges[{idx}]"
-        edges_by_source.setdefault(edge.from_node, []).append((idx, edge))
+    # Hoisted membership targets: on well-formed edges (the common case)
+    # each endpoint costs one hash probe, with sentinel string compares
+    # deferred to the error path. Sentinels are subtracted so a node that
+    # happens to be named START/END still triggers the sentinel errors.
+    valid_edge_sources = node_id_set - _SENTINEL_NODES
+    valid_edge_targets = (node_id_set - {"START"}) | {"END"}
 
-        if edge.from_node == "START":
-            errors.append(
-                GraphConfigValidationError(
-                    code="EDGE_FROM_START_FORBIDDEN",
-                    path=f"{edge_path}.from_node",
-                    message="Uses graph.entrypoints[]; START edges are not allowed.",
+    routing_by_source: dict[str, _SourceRouting] = {}
+    # Error paths interpolate idx directly so valid edges (the common case)
+    # allocate no per-edge path string.
+    for idx, edge in enumerate(edges):
+        routing = routing_by_source.get(edge.from_node)
+        if routing is None:
+            routing = routing_by_source[edge.from_node] = _SourceRouting()
+
+        if edge.from_node not in valid_edge_sources:
+            if edge.from_node == "START":
+                errors.append(
+                    GraphConfigValidationError(
+                        code="EDGE_FROM_START_FORBIDDEN",
+                        path=f"graph.edges[{idx}].from_node",
+                        message="Uses graph.entrypoints[]; START edges are not allowed.",
+                    )
                 )
-            )
-        elif edge.from_node == "END":
-            errors.append(
-                GraphConfigValidationError(
-                    code="EDGE_FROM_END_FORBIDDEN",
-                    path=f"{edge_path}.from_node",
-                    message="END cannot be used as an edge source.",
+            elif edge.from_node == "END":
+                errors.append(
+                    GraphConfigValidationError(
+                        code="EDGE_FROM_END_FORBIDDEN",
+                        path=f"graph.edges[{idx}].from_node",
+                        message="END cannot be used as an edge source.",
+                    )
                 )
-            )
-        elif edge.from_node not in node_id_set:
-            errors.append(
-                GraphConfigValidationError(
-                    code="EDGE_SOURCE_NOT_FOUND",
-                    path=f"{edge_path}.from_node",
-                    message=f"Edge source '{edge.from_node}' does not exist.",
+            else:
+                errors.append(
+                    GraphConfigValidationError(
+                        code="EDGE_SOURCE_NOT_FOUND",
+                        path=f"graph.edges[{idx}].from_node",
+                        message=f"Edge source '{edge.from_node}' does not exist.",
+                    )
                 )
-            )
 
-        if edge.to_node == "START":
-            errors.append(
-                GraphConfigValidationError(
-                    code="EDGE_TO_START_FORBIDDEN",
-                    path=f"{edge_path}.to_node",
-                    message="START cannot be used as an edge target.",
+        if edge.to_node not in valid_edge_targets:
+            if edge.to_node == "START":
+                errors.append(
+                    GraphConfigValidationError(
+                        code="EDGE_TO_START_FORBIDDEN",
+                        path=f"graph.edges[{idx}].to_node",
+                        message="START cannot be used as an edge target.",
+                    )
                 )
-            )
-        elif edge.to_node != "END" and edge.to_node not in node_id_set:
-            errors.append(
-                GraphConfigValidationError(
-                    code="EDGE_TARGET_NOT_FOUND",
-                    path=f"{edge_path}.to_node",
-                    message=f"Edge target '{edge.to_node}' does not exist.",
+            else:
+                errors.append(
+                    GraphConfigValidationError(
+                        code="EDGE_TARGET_NOT_FOUND",
+                        path=f"graph.edges[{idx}].to_node",
+                        message=f"Edge target '{edge.to_node}' does not exist.",
+                    )
                 )
-            )
 
-        if isinstance(edge.when, EdgePredicate) and edge.when.state_path not in state_paths:
-            errors.append(
-                GraphConfigValidationError(
-                    code="PREDICATE_STATE_PATH_MISSING",
-                    path=f"{edge_path}.when.state_path",
-                    message=(
-                        f"Predicate state_path '{edge.when.state_path}' is missing in state.schema "
-                        "and is not a built-in state path."
-                    ),
+        # Classify routing in the same pass. Enum members are singletons,
+        # so `is` replaces the isinstance + equality pair.
+        when = edge.when
+        if when is None:
+            if routing.default_first < 0:
+                routing.default_first = idx
+            elif routing.default_second < 0:
+                routing.default_second = idx
+        elif when is BuiltinEdgeCondition.HAS_TOOL_CALLS:
+            if routing.has_tool_first < 0:
+                routing.has_tool_first = idx
+            elif routing.has_tool_second < 0:
+                routing.has_tool_second = idx
+        elif when is BuiltinEdgeCondition.NO_TOOL_CALLS:
+            if routing.no_tool_first < 0:
+                routing.no_tool_first = idx
+            elif routing.no_tool_second < 0:
+                routing.no_tool_second = idx
+        elif isinstance(when, EdgePredicate):
+            if routing.custom_first < 0:
+                routing.custom_first = idx
+            if when.state_path not in state_paths:
+                errors.append(
+                    GraphConfigValidationError(
+                        code="PREDICATE_STATE_PATH_MISSING",
+                        path=f"graph.edges[{idx}].when.state_path",
+                        message=(
+                            f"Predicate state_path '{when.state_path}' is missing in state.schema "
+                            "and is not a built-in state path."
+                        ),
+                    )
                 )
-            )
 
-    # Determinism checks per source node.
-    for source, edge_entries in edges_by_source.items():
-        default_edges = [(idx, edge) for idx, edge in edge_entries if edge.when is None]
-        if len(default_edges) > 1:
+    # Determinism checks per source node, read off the tallies collected
+    # during the single edge pass above.
+    for source, routing in routing_by_source.items():
+        if routing.default_second >= 0:
             errors.append(
                 GraphConfigValidationError(
                     code="MULTIPLE_DEFAULT_EDGES",
-                    path=f"graph.edges[{default_edges[1][0]}].when",
+                    path=f"graph.edges[{routing.default_second}].when",
                     message=f"Node '{source}' has more than one unconditional edge.",
                 )
             )
-
-        has_tool_edges = [
-            (idx, edge)
-            for idx, edge in edge_entries
-            if isinstance(edge.when, BuiltinEdgeCondition) and edge.when == BuiltinEdgeCondition.HAS_TOOL_CALLS
-        ]
-        no_tool_edges = [
-            (idx, edge)
-            for idx, edge in edge_entries
-            if isinstance(edge.when, BuiltinEdgeCondition) and edge.when == BuiltinEdgeCondition.NO_TOOL_CALLS
-        ]
-        custom_predicate_edges = [(idx, edge) for idx, edge in edge_entries if isinstance(edge.when, EdgePredicate)]
-
-        if len(has_tool_edges) > 1:
+        if routing.has_tool_second >= 0:
             errors.append(
                 GraphConfigValidationError(
                     code="DUPLICATE_HAS_TOOL_CALLS_EDGE",
-                    path=f"graph.edges[{has_tool_edges[1][0]}].when",
+                    path=f"graph.edges[{routing.has_tool_second}].when",
                     message=f"Node '{source}' has duplicate has_tool_calls edges.",
                 )
             )
-        if len(no_tool_edges) > 1:
+        if routing.no_tool_second >= 0:
             errors.append(
                 GraphConfigValidationError(
                     code="DUPLICATE_NO_TOOL_CALLS_EDGE",
-                    path=f"graph.edges[{no_tool_edges[1][0]}].when",
+                    path=f"graph.edges[{routing.no_tool_second}].when",
                     message=f"Node '{source}' has duplicate no_tool_calls edges.",
                 )
             )
-        if (has_tool_edges or no_tool_edges) and custom_predicate_edges:
+        if (routing.has_tool_first >= 0 or routing.no_tool_first >= 0) and routing.custom_first >= 0:
             errors.append(
                 GraphConfigValidationError(
                     code="MIXED_BUILTIN_AND_CUSTOM_ROUTING",
-                    path=f"graph.edges[{custom_predicate_edges[0][0]}].when",
+                    path=f"graph.edges[{routing.custom_first}].when",
                     message=f"Node '{source}' mixes built-in tool routing and custom predicates.",
                 )
             )
 
-    adjacency = _build_adjacency(edges, node_id_set)
-    reachable = _reachable_from_entrypoints(entrypoints, adjacency)
+    reachable, end_reachable, has_cycle = _sweep_graph(entrypoints, edges, node_id_set)
     unreachable = node_id_set - reachable
     if unreachable:
         errors.append(
@@ -270,7 +354,7 @@ def validate_graph_config(config: GraphConfig) -> list[GraphConfigValidationErro
             )
         )
 
-    if not _is_end_reachable(entrypoints, edges):
+    if not end_reachable:
         errors.append(
             GraphConfigValidationError(
                 code="END_UNREACHABLE",
@@ -279,7 +363,7 @@ def validate_graph_config(config: GraphConfig) -> list[GraphConfigValidationErro
             )
         )
 
-    if _has_cycle(adjacency):
+    if has_cycle:
         if config.limits.max_steps <= 0 and config.limits.max_time_s <= 0:
             errors.append(
                 GraphConfigValidationError(
@@ -10,7 +10,8 @@ This module provides type definitions for:
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, Awaitable, Callable, TypedDict, TypeVar
+import asyncio
+from typing import TYPE_CHECKING, Any, AsyncIterator, Awaitable, Callable, TypedDict, TypeVar
 
 from langchain_core.messages import BaseMessage
 from langgraph.graph.state import CompiledStateGraph, StateGraph
@@ -61,6 +62,47 @@ DynamicStateGraph = StateGraph[BaseModel, None, BaseModel, BaseModel]
 DynamicCompiledGraph = CompiledStateGraph[BaseModel, None, BaseModel, BaseModel]
 
 
+# =============================================================================
+# Lazy Compilation Wrapper
+# =============================================================================
+
+
+class LazyCompiledGraph:
+    """
+    Defers LangGraph compilation until the graph is actually used.
+
+    Wraps a zero-arg async builder. The first astream/ainvoke call runs the
+    builder under an asyncio.Lock and caches the compiled graph; subsequent
+    calls forward directly. This keeps Pregel construction off the
+    time-to-first-token path and skips it entirely for abandoned requests.
+    """
+
+    __slots__ = ("_builder", "_compiled", "_lock")
+
+    def __init__(self, builder: Callable[[], Awaitable[DynamicCompiledGraph]]) -> None:
+        self._builder = builder
+        self._compiled: DynamicCompiledGraph | None = None
+        self._lock = asyncio.Lock()
+
+    async def _ensure_compiled(self) -> DynamicCompiledGraph:
+        compiled = self._compiled
+        if compiled is not None:
+            return compiled
+        async with self._lock:
+            if self._compiled is None:
+                self._compiled = await self._builder()
+            return self._compiled
+
+    async def ainvoke(self, *args: Any, **kwargs: Any) -> Any:
+        graph = await self._ensure_compiled()
+        return await graph.ainvoke(*args, **kwargs)
+
+    async def astream(self, *args: Any, **kwargs: Any) -> AsyncIterator[Any]:
+        graph = await self._ensure_compiled()
+        async for chunk in graph.astream(*args, **kwargs):
+            yield chunk
+
+
 # =============================================================================
 # Node Function Types
 # =============================================================================
@@ -127,6 +169,7 @@ __all__ = [
     "TypedCompiledGraph",
     "DynamicStateGraph",
     "DynamicCompiledGraph",
+    "LazyCompiledGraph",
     # Function types
     "NodeFunction",
     "RouterFunction",
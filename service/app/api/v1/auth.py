@@ -1,3 +1,4 @@
+import asyncio
 import logging
 from typing import Optional
 
@@ -12,13 +13,17 @@ from app.core.rate_limit import (
     enforce_send_code_rate_limit,
     enforce_signup_rate_limit,
 )
-from app.middleware.auth import AuthProvider
+from app.middleware.auth import AuthProvider, AuthResult
 from app.middleware.auth.casdoor import CasdoorAuthProvider
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(tags=["auth"])
 
+# AuthProvider is a module-level singleton and its name is a constant, so
+# resolve it once instead of per request on the auth hot paths.
+_PROVIDER_NAME = AuthProvider.get_provider_name()
+
 
 # ---------------------------------------------------------------------------
 # Models
@@ -149,6 +154,8 @@ class DisplayNameUpdateResponse(BaseModel):
 
 _GMAIL_DOMAINS = {"gmail.com", "googlemail.com"}
 
+_ALLOWED_IMAGE_TYPES: frozenset[str] = frozenset({"image/png", "image/jpeg", "image/jpg", "image/gif", "image/webp"})
+
 
 def _normalize_email(email: str) -> str:
     """Lowercase domain; strip dots from Gmail local part."""
@@ -171,6 +178,22 @@ def _validate_email_format(email: str) -> None:
         )
 
 
+def bearer_token(authorization: Optional[str] = Header(None, description="Bearer token")) -> str:
+    """FastAPI dependency extracting the Bearer access token from the header.
+
+    Shared by the account-management endpoints so each handler receives the
+    parsed token instead of re-implementing the header check.
+    """
+    if not authorization:
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Missing or invalid authorization header")
+    # removeprefix checks and strips in one C call, returning the original
+    # object when the prefix is absent - an identity test detects that.
+    access_token = authorization.removeprefix("Bearer ")
+    if access_token is authorization:
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Missing or invalid authorization header")
+    return access_token
+
+
 def _require_casdoor() -> tuple[CasdoorAuthProvider, str, str, str, str]:
     """Return ``(provider, org, app, client_secret, app_id)`` or raise."""
     provider = AuthProvider
@@ -319,12 +342,11 @@ def _casdoor_code_login(
 
 @router.get("/status", response_model=AuthStatusResponse)
 async def get_auth_status() -> AuthStatusResponse:
-    provider = AuthProvider
-    logger.info(f"认证服务已配置，使用提供商: {provider.get_provider_name()}")
+    logger.info(f"认证服务已配置，使用提供商: {_PROVIDER_NAME}")
     return AuthStatusResponse(
         is_configured=True,
-        provider=provider.get_provider_name(),
-        message=f"认证服务已配置 ({provider.get_provider_name()})",
+        provider=_PROVIDER_NAME,
+        message=f"认证服务已配置 ({_PROVIDER_NAME})",
     )
 
 
@@ -334,7 +356,7 @@ async def get_auth_config() -> AuthProviderConfigResponse:
 
     provider = AuthProvider
     return AuthProviderConfigResponse(
-        provider=provider.get_provider_name(),
+        provider=_PROVIDER_NAME,
         issuer=getattr(provider, "issuer", None),
         audience=getattr(provider, "audience", None),
         jwks_uri=getattr(provider, "jwks_uri", None),
@@ -350,59 +372,65 @@ async def get_auth_config() -> AuthProviderConfigResponse:
 # ---------------------------------------------------------------------------
 
 
-@router.post("/validate", response_model=AuthValidationResponse)
-async def validate_token(
-    authorization: Optional[str] = Header(None, description="Bearer token"),
-) -> AuthValidationResponse:
-    """验证 access_token 并返回用户信息"""
-    logger.info("开始验证 access_token")
+def _validate_bearer(authorization: Optional[str]) -> tuple[AuthResult, Optional[UserInfoResponse]]:
+    """Parse the Bearer header, validate the token and convert the user info.
+
+    Shared by the ``/validate`` and ``/me`` endpoints so ``/me`` does not
+    re-enter the API handler and build a response model it discards.
+    Raises HTTPException for malformed headers; validation failures are
+    returned in the AuthResult for the caller to shape.
+    """
+    # Per-request tracing is debug-level with %s lazy formatting, so at
+    # production log levels the hot path skips the string slicing and
+    # message assembly entirely.
+    debug_enabled = logger.isEnabledFor(logging.DEBUG)
 
     if not authorization:
         logger.warning("缺少 Authorization header")
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Missing authorization header")
 
-    logger.info(f"收到 Authorization header: {authorization[:20]}..." if len(authorization) > 20 else authorization)
+    if debug_enabled:
+        logger.debug("收到 Authorization header: %.20s...", authorization)
 
-    if not authorization.startswith("Bearer "):
+    access_token = authorization.removeprefix("Bearer ")
+    if access_token is authorization:
         logger.warning("Authorization header 格式无效，不是 Bearer 格式")
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid authorization header format")
 
-    access_token = authorization[7:]
-    logger.info(f"解析得到 access_token (前20字符): {access_token[:20]}...")
-
     provider = AuthProvider
     if not provider:
         logger.error("认证提供商初始化失败")
         raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail="认证提供商初始化失败")
 
-    logger.info(f"使用认证提供商: {provider.get_provider_name()}")
-    logger.info("开始调用提供商验证token...")
+    if debug_enabled:
+        logger.debug("使用认证提供商 %s 验证 access_token (前20字符): %.20s...", _PROVIDER_NAME, access_token)
     auth_result = provider.validate_token(access_token)
-    logger.info(
-        f"提供商验证结果: success={auth_result.success}, "
-        f"error_code={auth_result.error_code}, error_message={auth_result.error_message}"
-    )
+    if debug_enabled:
+        logger.debug(
+            "提供商验证结果: success=%s, error_code=%s, error_message=%s",
+            auth_result.success,
+            auth_result.error_code,
+            auth_result.error_message,
+        )
 
     if not auth_result.success:
-        logger.warning(f"Token验证失败: {auth_result.error_message} (code: {auth_result.error_code})")
-        return AuthValidationResponse(
-            success=False, error_code=auth_result.error_code, error_message=auth_result.error_message
-        )
+        logger.warning("Token验证失败: %s (code: %s)", auth_result.error_message, auth_result.error_code)
+        return auth_result, None
 
     user_info = None
     if auth_result.user_info:
-        logger.info(
-            f"验证成功，用户信息: id={auth_result.user_info.id}, "
-            f"username={auth_result.user_info.username}, "
-            f"display_name={auth_result.user_info.display_name}, "
-            f"avatar_url={auth_result.user_info.avatar_url}"
-        )
+        if debug_enabled:
+            logger.debug(
+                "验证成功，用户信息: id=%s, username=%s, display_name=%s, avatar_url=%s",
+                auth_result.user_info.id,
+                auth_result.user_info.username,
+                auth_result.user_info.display_name,
+                auth_result.user_info.avatar_url,
+            )
         user_info = _to_user_info(auth_result.user_info)
     else:
         logger.warning("验证成功但没有用户信息")
 
-    logger.info("Token验证完成，返回成功结果")
-
     # Fire-and-forget: ensure Novu subscriber exists (never blocks auth)
     if user_info:
         try:
@@ -416,6 +444,19 @@ async def validate_token(
         except Exception:
             pass
 
+    return auth_result, user_info
+
+
+@router.post("/validate", response_model=AuthValidationResponse)
+async def validate_token(
+    authorization: Optional[str] = Header(None, description="Bearer token"),
+) -> AuthValidationResponse:
+    """验证 access_token 并返回用户信息"""
+    auth_result, user_info = _validate_bearer(authorization)
+    if not auth_result.success:
+        return AuthValidationResponse(
+            success=False, error_code=auth_result.error_code, error_message=auth_result.error_message
+        )
     return AuthValidationResponse(success=True, user_info=user_info)
 
 
@@ -424,15 +465,15 @@ async def get_current_user(
     authorization: Optional[str] = Header(None, description="Bearer token"),
 ) -> UserInfoResponse:
     """获取当前用户信息（需要有效的 token）"""
-    validation_result = await validate_token(authorization)
+    auth_result, user_info = _validate_bearer(authorization)
 
-    if not validation_result.success or not validation_result.user_info:
+    if not auth_result.success or not user_info:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
-            detail=validation_result.error_message or "Token validation failed",
+            detail=auth_result.error_message or "Token validation failed",
         )
 
-    return validation_result.user_info
+    return user_info
 
 
 # ---------------------------------------------------------------------------
@@ -706,14 +747,10 @@ async def reset_password(
 
 @router.get("/linked-accounts", response_model=LinkedAccountsResponse)
 async def get_linked_accounts(
-    authorization: Optional[str] = Header(None, description="Bearer token"),
+    access_token: str = Depends(bearer_token),
     validate: bool = Query(False, description="是否验证第三方 token 有效性"),
 ) -> LinkedAccountsResponse:
     """获取用户已绑定的第三方账户列表"""
-    if not authorization or not authorization.startswith("Bearer "):
-        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Missing or invalid authorization header")
-
-    access_token = authorization[7:]
     provider = AuthProvider
 
     if not isinstance(provider, CasdoorAuthProvider):
@@ -726,11 +763,22 @@ async def get_linked_accounts(
 
     if validate and linked_accounts:
         original_tokens = provider.get_original_tokens(access_token)
-        for account in linked_accounts:
-            if account.provider_name in original_tokens:
-                account.is_valid = provider.validate_third_party_token(
-                    account.provider_name, original_tokens[account.provider_name]
+        # Each validation is a blocking HTTP round-trip; fan out to threads
+        # so K linked providers cost ~one RTT instead of K serial ones.
+        to_check = [account for account in linked_accounts if account.provider_name in original_tokens]
+        if to_check:
+            results = await asyncio.gather(
+                *(
+                    asyncio.to_thread(
+                        provider.validate_third_party_token,
+                        account.provider_name,
+                        original_tokens[account.provider_name],
+                    )
+                    for account in to_check
                 )
+            )
+            for account, is_valid in zip(to_check, results):
+                account.is_valid = is_valid
 
     return LinkedAccountsResponse(
         accounts=[
@@ -753,12 +801,9 @@ async def get_linked_accounts(
 async def get_link_url(
     provider_type: str = Query(..., description="Provider 类型，如 Custom, GitHub"),
     redirect_uri: str = Query(..., description="绑定完成后的回调地址"),
-    authorization: Optional[str] = Header(None, description="Bearer token"),
+    _access_token: str = Depends(bearer_token),
 ) -> LinkUrlResponse:
     """获取第三方账户绑定 URL"""
-    if not authorization or not authorization.startswith("Bearer "):
-        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Missing or invalid authorization header")
-
     provider = AuthProvider
 
     if not isinstance(provider, CasdoorAuthProvider):
@@ -774,13 +819,9 @@ async def get_link_url(
 @router.post("/avatar", response_model=AvatarUpdateResponse)
 async def update_avatar(
     file: UploadFile = File(..., description="头像图片文件"),
-    authorization: Optional[str] = Header(None, description="Bearer token"),
+    access_token: str = Depends(bearer_token),
 ) -> AvatarUpdateResponse:
     """上传并更新用户头像 (PNG/JPG/GIF/WebP, ≤5 MB)"""
-    if not authorization or not authorization.startswith("Bearer "):
-        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Missing or invalid authorization header")
-
-    access_token = authorization[7:]
     provider = AuthProvider
 
     if not isinstance(provider, CasdoorAuthProvider):
@@ -789,16 +830,28 @@ async def update_avatar(
             detail="Avatar update is only available with Casdoor provider",
         )
 
-    allowed_types = ["image/png", "image/jpeg", "image/jpg", "image/gif", "image/webp"]
-    if file.content_type not in allowed_types:
+    if file.content_type not in _ALLOWED_IMAGE_TYPES:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Invalid file type. Allowed types: {', '.join(allowed_types)}",
+            detail=f"Invalid file type. Allowed types: {', '.join(sorted(_ALLOWED_IMAGE_TYPES))}",
         )
 
-    file_data = await file.read()
-    if len(file_data) > 5 * 1024 * 1024:
-        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="File size exceeds 5MB limit")
+    max_size = 5 * 1024 * 1024
+
+    # O(1) early rejection when the client declares the part size.
+    if file.size is not None and file.size > max_size:
+        raise HTTPException(status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE, detail="File size exceeds 5MB limit")
+
+    # Stream in bounded chunks so an oversized (or lying) upload is rejected
+    # without ever buffering the full body in memory.
+    buffer = bytearray()
+    while chunk := await file.read(64 * 1024):
+        buffer.extend(chunk)
+        if len(buffer) > max_size:
+            raise HTTPException(
+                status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE, detail="File size exceeds 5MB limit"
+            )
+    file_data = bytes(buffer)
 
     avatar_url = provider.upload_avatar(
         access_token=access_token,
@@ -821,19 +874,15 @@ async def update_avatar(
 @router.post("/display-name", response_model=DisplayNameUpdateResponse)
 async def update_display_name(
     request: DisplayNameUpdateRequest,
-    authorization: Optional[str] = Header(None, description="Bearer token"),
+    access_token: str = Depends(bearer_token),
 ) -> DisplayNameUpdateResponse:
     """更新用户显示名称 (1-50 字符)"""
-    if not authorization or not authorization.startswith("Bearer "):
-        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Missing or invalid authorization header")
-
     display_name = request.display_name.strip()
     if not display_name or len(display_name) < 1:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Display name cannot be empty")
     if len(display_name) > 50:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Display name cannot exceed 50 characters")
 
-    access_token = authorization[7:]
     provider = AuthProvider
 
     if not isinstance(provider, CasdoorAuthProvider):
@@ -8,7 +8,7 @@ from app.api.v1.sessions import get_current_user
 from app.infra.database import get_session
 from app.models.message import Message as MessageModel
 from app.models.message import MessageRead, MessageUpdate
-from app.repos import MessageRepository, SessionRepository, TopicRepository
+from app.repos import MessageRepository
 
 router = APIRouter(tags=["messages"])
 
@@ -32,14 +32,21 @@ class MessageEditResponse(BaseModel):
     regenerate: bool = Field(..., description="Whether frontend should trigger regeneration")
 
 
-async def _verify_message_authorization(message_id: UUID, user: str, db: AsyncSession) -> tuple[MessageModel, UUID]:
+def get_message_repository(db: AsyncSession = Depends(get_session)) -> MessageRepository:
+    """Per-request MessageRepository shared across handler and helpers via DI caching."""
+    return MessageRepository(db)
+
+
+async def _verify_message_authorization(
+    message_id: UUID, user: str, message_repo: MessageRepository
+) -> tuple[MessageModel, UUID]:
     """
     Core authorization logic for message access validation.
 
     Args:
         message_id: UUID of the message to verify
         user: Authenticated user ID
-        db: Database session
+        message_repo: Message repository bound to the request's session
 
     Returns:
         tuple[MessageModel, UUID]: The authorized message and its topic_id
@@ -47,26 +54,15 @@ async def _verify_message_authorization(message_id: UUID, user: str, db: AsyncSe
     Raises:
         HTTPException: 404 if message/topic/session not found, 403 if access denied
     """
-    message_repo = MessageRepository(db)
-    topic_repo = TopicRepository(db)
-    session_repo = SessionRepository(db)
-
-    message = await message_repo.get_message_by_id(message_id)
-    if not message:
+    row = await message_repo.get_message_with_owner(message_id)
+    if row is None:
         raise HTTPException(status_code=404, detail="Message not found")
 
-    topic = await topic_repo.get_topic_by_id(message.topic_id)
-    if not topic:
-        raise HTTPException(status_code=404, detail="Topic not found")
-
-    session = await session_repo.get_session_by_id(topic.session_id)
-    if not session:
-        raise HTTPException(status_code=404, detail="Session not found")
-
-    if session.user_id != user:
+    message, topic_id, owner_id = row
+    if owner_id != user:
         raise HTTPException(status_code=403, detail="Access denied: You don't have permission to access this message")
 
-    return message, topic.id
+    return message, topic_id
 
 
 @router.patch("/{message_id}", response_model=MessageEditResponse)
@@ -75,6 +71,7 @@ async def edit_message(
     edit_request: MessageEditRequest,
     user: str = Depends(get_current_user),
     db: AsyncSession = Depends(get_session),
+    message_repo: MessageRepository = Depends(get_message_repository),
 ) -> MessageEditResponse:
     """
     Edit a message content, optionally truncating subsequent messages.
@@ -102,7 +99,7 @@ async def edit_message(
         HTTPException: 404 if message/topic/session not found, 403 if access denied,
                        400 if trying to regenerate from non-user message
     """
-    message, topic_id = await _verify_message_authorization(message_id, user, db)
+    message, topic_id = await _verify_message_authorization(message_id, user, message_repo)
 
     # Regeneration is only allowed for user messages
     if edit_request.truncate_and_regenerate and message.role != "user":
@@ -111,8 +108,6 @@ async def edit_message(
             detail="Regeneration can only be triggered from user messages",
         )
 
-    message_repo = MessageRepository(db)
-
     # Update the message content
     update_data = MessageUpdate(content=edit_request.content)
     updated_message = await message_repo.update_message(message_id, update_data)
@@ -132,15 +127,7 @@ async def edit_message(
     await db.commit()
 
     return MessageEditResponse(
-        message=MessageRead(
-            id=updated_message.id,
-            role=updated_message.role,
-            content=updated_message.content,
-            topic_id=updated_message.topic_id,
-            created_at=updated_message.created_at,
-            thinking_content=updated_message.thinking_content,
-            agent_metadata=updated_message.agent_metadata,
-        ),
+        message=MessageRead.model_validate(updated_message),
         deleted_count=deleted_count,
         regenerate=regenerate,
     )
@@ -151,6 +138,7 @@ async def delete_message(
     message_id: UUID,
     user: str = Depends(get_current_user),
     db: AsyncSession = Depends(get_session),
+    message_repo: MessageRepository = Depends(get_message_repository),
 ) -> None:
     """
     Delete a single message.
@@ -172,9 +160,7 @@ async def delete_message(
     Raises:
         HTTPException: 404 if message/topic/session not found, 403 if access denied
     """
-    message, _ = await _verify_message_authorization(message_id, user, db)
-
-    message_repo = MessageRepository(db)
+    message, _ = await _verify_message_authorization(message_id, user, message_repo)
 
     # Delete the message with cascade
     deleted = await message_repo.delete_message(message.id, cascade_files=True)
@@ -12,12 +12,12 @@ import json
 import logging
 from typing import TYPE_CHECKING, Any, AsyncGenerator
 
-from langgraph.graph.state import CompiledStateGraph
 from langchain_core.runnables import RunnableConfig
 from sqlmodel.ext.asyncio.session import AsyncSession
 
 from app.tools.mcp import format_tool_result_structured
 from app.core.chat.agent_event_handler import AgentEventContext
+from app.agents.types import LazyCompiledGraph
 from app.core.chat.history import load_conversation_history
 from app.core.chat.stream_handlers import (
     CitationExtractor,
@@ -386,7 +386,7 @@ async def create_langchain_agent(
     system_prompt: str,
     prompt_layers: "SystemPromptLayers | None" = None,
     model_tier: str | None = None,
-) -> tuple[CompiledStateGraph[Any, None, Any, Any], AgentEventContext, Any]:
+) -> tuple[LazyCompiledGraph, AgentEventContext, Any]:
     """Create and configure the LangChain agent using the agent factory.
 
     Returns:
@@ -532,7 +532,7 @@ def _detect_interrupt(data: dict[str, Any], ctx: StreamContext, thread_id: str)
 
 
 async def _process_agent_stream(
-    agent: CompiledStateGraph[Any, None, Any, Any],
+    agent: LazyCompiledGraph,
     history_messages: list[Any],
     ctx: StreamContext,
 ) -> AsyncGenerator[StreamingEvent, None]:
@@ -688,7 +688,7 @@ async def _process_agent_stream(
 
 
 async def resume_agent_from_interrupt(
-    agent: CompiledStateGraph[Any, None, Any, Any],
+    agent: LazyCompiledGraph,
     user_response: dict[str, Any],
     thread_id: str,
     ctx: StreamContext,
@@ -1,5 +1,7 @@
+import json
 import logging
 from datetime import datetime, timezone
+from hashlib import blake2b
 from typing import Any, Sequence
 from uuid import UUID
 
@@ -31,6 +33,14 @@ from app.repos.mcp import McpRepository
 logger = logging.getLogger(__name__)
 
 
+def compute_config_hash(graph_config: dict[str, Any] | None) -> str | None:
+    """blake2b-128 hex digest of the canonical (sort_keys) graph_config JSON."""
+    if not graph_config:
+        return None
+    canonical = json.dumps(graph_config, sort_keys=True)
+    return blake2b(canonical.encode("utf-8"), digest_size=16).hexdigest()
+
+
 class AgentMarketplaceService:
     """Service for managing agent marketplace operations"""
 
@@ -141,6 +151,7 @@ class AgentMarketplaceService:
         snapshot_data = AgentSnapshotCreate(
             agent_id=agent.id,
             configuration=configuration,
+            config_hash=compute_config_hash(agent.graph_config),
             mcp_server_configs=mcp_server_configs,
             knowledge_set_config=knowledge_set_config,
             skill_configs=skill_configs,
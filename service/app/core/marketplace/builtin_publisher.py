@@ -1,13 +1,17 @@
-import json
+import asyncio
 import logging
+from functools import lru_cache
 from uuid import UUID
 
-from sqlmodel import select
+from sqlalchemy import delete as sa_delete
+from sqlalchemy.ext.asyncio import async_sessionmaker
+from sqlmodel import col
 from sqlmodel.ext.asyncio.session import AsyncSession
 
 from app.agents.builtin import get_builtin_config, get_builtin_metadata, list_builtin_keys
-from app.core.marketplace.agent_marketplace_service import AgentMarketplaceService
-from app.models.agent import Agent, AgentCreate, AgentScope, ForkMode
+from app.core.marketplace.agent_marketplace_service import AgentMarketplaceService, compute_config_hash
+from app.infra.database import AsyncSessionLocal
+from app.models.agent import Agent, AgentCreate, AgentScope, AgentUpdate, ForkMode
 from app.models.agent_marketplace import (
     AgentMarketplace,
     AgentMarketplaceCreate,
@@ -15,12 +19,28 @@ from app.models.agent_marketplace import (
     MarketplaceScope,
 )
 from app.models.agent_snapshot import AgentSnapshot
+from app.models.links import AgentMcpServerLink
 from app.repos import AgentMarketplaceRepository, AgentRepository, AgentSnapshotRepository
 from app.schemas.graph_config import GraphConfig
 
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=None)
+def _builtin_config_digest(key: str) -> str:
+    """
+    Digest of the canonical builtin config JSON, memoized per builtin key.
+
+    Builtin configs are static for the lifetime of the process, so the
+    serialization only has to happen once per key instead of on every
+    reconciliation pass.
+    """
+    config = get_builtin_config(key)
+    if config is None:
+        return ""
+    return compute_config_hash(config.model_dump()) or ""
+
+
 class BuiltinMarketplacePublisher:
     """Publishes builtin agents as OFFICIAL marketplace listings on server startup."""
 
@@ -46,31 +66,83 @@ class BuiltinMarketplacePublisher:
             Mapping of builtin key to marketplace listing UUID.
         """
         result: dict[str, UUID] = {}
+        keys = list_builtin_keys()
+
+        # Batch-load existing listings and their active snapshots up front so
+        # reconciliation doesn't issue per-key lookups.
+        existing = await self.marketplace_repo.get_all_by_builtin_keys(keys)
+        listings_by_key = {listing.builtin_key: listing for listing in existing if listing.builtin_key}
+        snapshots = await self.snapshot_repo.get_snapshots_by_ids([listing.active_snapshot_id for listing in existing])
+        snapshots_by_id = {snapshot.id: snapshot for snapshot in snapshots}
+
+        for key in keys:
+            listing = listings_by_key.get(key)
+            snapshot = snapshots_by_id.get(listing.active_snapshot_id) if listing else None
+            listing_id = await self._reconcile_key(key, listing, snapshot)
+            if listing_id is not None:
+                result[key] = listing_id
 
-        for key in list_builtin_keys():
-            config = get_builtin_config(key)
-            metadata = get_builtin_metadata(key)
-            if not config or not metadata:
-                logger.warning(f"Skipping builtin key '{key}': missing config or metadata")
-                continue
+        return result
 
-            publishable = metadata.get("publishable", True)
-            listing = await self.marketplace_repo.get_by_builtin_key(key)
+    @classmethod
+    async def ensure_builtin_listings_concurrent(
+        cls, session_factory: async_sessionmaker[AsyncSession] | None = None
+    ) -> dict[str, UUID]:
+        """
+        Reconcile every builtin key concurrently, one session per key.
 
-            if not publishable:
-                if listing is not None:
-                    await self._remove_listing(key, listing)
-                continue
+        Builtin keys are independent (distinct agent_id/builtin_key), but a
+        single AsyncSession cannot serve concurrent awaits, so each task gets
+        its own session from the factory and commits itself. Wall-clock cost
+        drops from the sum of per-key round-trips to roughly the slowest key.
 
-            if listing is None:
-                listing = await self._create_listing(key, config, metadata)
-                logger.info(f"Created OFFICIAL marketplace listing for '{key}': {listing.id}")
-            else:
-                listing = await self._update_if_changed(key, config, metadata, listing)
+        Args:
+            session_factory: Session factory for the per-key sessions.
+                Defaults to the global AsyncSessionLocal.
 
-            result[key] = listing.id
+        Returns:
+            Mapping of builtin key to marketplace listing UUID.
+        """
+        factory = session_factory or AsyncSessionLocal
+
+        async def _reconcile(key: str) -> tuple[str, UUID | None]:
+            async with factory() as db:
+                publisher = cls(db)
+                listing = await publisher.marketplace_repo.get_by_builtin_key(key)
+                snapshot = (
+                    await publisher.snapshot_repo.get_snapshot_by_id(listing.active_snapshot_id) if listing else None
+                )
+                listing_id = await publisher._reconcile_key(key, listing, snapshot)
+                await db.commit()
+                return key, listing_id
+
+        pairs = await asyncio.gather(*(_reconcile(key) for key in list_builtin_keys()))
+        return {key: listing_id for key, listing_id in pairs if listing_id is not None}
+
+    async def _reconcile_key(
+        self, key: str, listing: AgentMarketplace | None, snapshot: AgentSnapshot | None
+    ) -> UUID | None:
+        """Reconcile a single builtin key; returns the listing ID if one should exist."""
+        config = get_builtin_config(key)
+        metadata = get_builtin_metadata(key)
+        if not config or not metadata:
+            logger.warning(f"Skipping builtin key '{key}': missing config or metadata")
+            return None
+
+        publishable = metadata.get("publishable", True)
+
+        if not publishable:
+            if listing is not None:
+                await self._remove_listing(key, listing)
+            return None
+
+        if listing is None:
+            listing = await self._create_listing(key, config, metadata)
+            logger.info(f"Created OFFICIAL marketplace listing for '{key}': {listing.id}")
+        else:
+            listing = await self._update_if_changed(key, config, metadata, listing, snapshot)
 
-        return result
+        return listing.id
 
     async def _create_listing(self, key: str, config: GraphConfig, metadata: dict[str, str]) -> AgentMarketplace:
         """Create Agent, Snapshot, and Marketplace listing for a builtin agent."""
@@ -122,42 +194,44 @@ class BuiltinMarketplacePublisher:
         """Remove a stale marketplace listing and its backing agent/snapshots."""
         agent_id = listing.agent_id
 
-        # Delete marketplace listing first (references snapshot + agent)
-        await self.marketplace_repo.delete_listing(listing.id)
-
-        # Delete snapshots for the backing agent
-        snapshots = await self.db.exec(select(AgentSnapshot).where(AgentSnapshot.agent_id == agent_id))
-        for snap in snapshots.all():
-            await self.db.delete(snap)
-
-        # Delete backing agent
-        await self.agent_repo.delete_agent(agent_id)
+        # One bulk DELETE per table on the shared session, with no refetches
+        # or intermediate flushes between them. Listing first (references
+        # snapshot + agent), then snapshots, MCP links, and the agent itself.
+        await self.db.exec(sa_delete(AgentMarketplace).where(col(AgentMarketplace.id) == listing.id))
+        await self.db.exec(sa_delete(AgentSnapshot).where(col(AgentSnapshot.agent_id) == agent_id))
+        await self.db.exec(sa_delete(AgentMcpServerLink).where(col(AgentMcpServerLink.agent_id) == agent_id))
+        await self.db.exec(sa_delete(Agent).where(col(Agent.id) == agent_id))
 
         logger.info(f"Removed stale marketplace listing for non-publishable builtin '{key}'")
 
     async def _update_if_changed(
-        self, key: str, config: GraphConfig, metadata: dict[str, str], listing: AgentMarketplace
+        self,
+        key: str,
+        config: GraphConfig,
+        metadata: dict[str, str],
+        listing: AgentMarketplace,
+        snapshot: AgentSnapshot | None,
     ) -> AgentMarketplace:
         """Update listing if the builtin config has changed since last publish."""
-        current_config_json = json.dumps(config.model_dump(), sort_keys=True)
+        current_digest = _builtin_config_digest(key)
 
-        # Get latest snapshot to compare
-        snapshot = await self.snapshot_repo.get_snapshot_by_id(listing.active_snapshot_id)
+        # Compare against the preloaded active snapshot; snapshots carry a
+        # stored config_hash, with a serialize-and-hash fallback for legacy
+        # rows created before the column existed.
         if snapshot:
-            existing_config = snapshot.configuration.get("graph_config")
-            existing_config_json = json.dumps(existing_config, sort_keys=True) if existing_config else ""
+            existing_digest = (
+                snapshot.config_hash or compute_config_hash(snapshot.configuration.get("graph_config")) or ""
+            )
         else:
-            existing_config_json = ""
+            existing_digest = ""
 
-        if current_config_json == existing_config_json:
+        if current_digest == existing_digest:
             logger.debug(f"Builtin '{key}' marketplace listing is up-to-date")
             return listing
 
         # Config changed — update agent and publish new snapshot
         logger.info(f"Builtin '{key}' config changed, updating marketplace listing")
 
-        from app.models.agent import AgentUpdate
-
         graph_config_dict = config.model_dump()
         display_name = metadata.get("display_name", key)
         description = metadata.get("description", "")
@@ -177,8 +251,9 @@ class BuiltinMarketplacePublisher:
             tags=tags,
             graph_config=graph_config_dict,
         )
-        await self.agent_repo.update_agent(agent.id, update_data)
-        await self.db.refresh(agent)
+        # update_agent already returns the refreshed ORM object; a second
+        # db.refresh here would just repeat the SELECT.
+        agent = await self.agent_repo.update_agent(agent.id, update_data) or agent
 
         # Create new snapshot
         snapshot = await self.marketplace_service.create_snapshot_from_agent(
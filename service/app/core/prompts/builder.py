@@ -9,6 +9,8 @@ from dataclasses import dataclass, field
 from abc import ABC, abstractmethod
 from enum import StrEnum
 import logging
+import re
+import threading
 from typing import Any
 from uuid import UUID
 
@@ -103,7 +105,7 @@ class BasePromptBuilder(ABC):
         return self
 
     def build(self) -> str:
-        return "".join([block.build() for block in self._blocks])
+        return "".join(block.build() for block in self._blocks)
 
     @abstractmethod
     def construct_prompt(self, agent: Agent | None, model_name: str | None) -> "BasePromptBuilder":
@@ -142,16 +144,73 @@ class ImageModelPromptBuilder(BasePromptBuilder):
         return self
 
 
+_IMAGE_MODEL_RE = re.compile(r"image|vision|dall-e", re.IGNORECASE)
+
+
 def _is_image_model(model_name: str | None) -> bool:
-    if not model_name:
-        return False
-    lowered = model_name.lower()
-    return "image" in lowered or "vision" in lowered or "dall-e" in lowered
+    return bool(model_name and _IMAGE_MODEL_RE.search(model_name))
 
 
 def _join_non_empty(parts: list[str]) -> str:
-    cleaned = [part.strip() for part in parts if part.strip()]
-    return "\n\n".join(cleaned)
+    return "\n\n".join(stripped for part in parts if (stripped := part.strip()))
+
+
+# Static block contents (persona, meta-instructions, tool/skill/format tail)
+# keyed by agent identity, model name, and attached skills. Only ContextBlock
+# changes between calls (current date/time), so everything else is built once
+# per agent revision instead of on every message.
+_STATIC_LAYER_CACHE: dict[tuple[Any, ...], tuple[str, str, str]] = {}
+_STATIC_LAYER_CACHE_MAX = 1024
+_STATIC_LAYER_CACHE_LOCK = threading.Lock()
+
+
+def _static_layer_contents(
+    config: PromptConfig,
+    agent: Agent | None,
+    model_name: str | None,
+    skills: list[SkillMetadata],
+) -> tuple[str, str, str]:
+    """Build (or recall) the time-independent block contents for an agent.
+
+    The prompt config is fully derived from the agent, so (agent.id,
+    agent.updated_at) keys any config change; skills are part of the key
+    because they load from the DB independently of the agent row.
+    """
+    agent_key = (agent.id, agent.updated_at) if agent is not None else None
+    skills_key = tuple((skill.name, skill.description) for skill in skills)
+    cache_key = (agent_key, model_name, skills_key)
+
+    with _STATIC_LAYER_CACHE_LOCK:
+        cached = _STATIC_LAYER_CACHE.pop(cache_key, None)
+        if cached is not None:
+            _STATIC_LAYER_CACHE[cache_key] = cached
+            return cached
+
+    agent_content = PersonaBlock(config).build().strip()
+    meta_content = MetaInstructionBlock(config).build()
+    tail_content = _join_non_empty(
+        [
+            ToolInstructionBlock(config, agent).build(),
+            SkillMetadataBlock(skills).build(),
+            FormatBlock(config, model_name).build(),
+        ]
+    )
+    cached = (agent_content, meta_content, tail_content)
+
+    with _STATIC_LAYER_CACHE_LOCK:
+        if len(_STATIC_LAYER_CACHE) >= _STATIC_LAYER_CACHE_MAX:
+            _STATIC_LAYER_CACHE.pop(next(iter(_STATIC_LAYER_CACHE)))
+        _STATIC_LAYER_CACHE[cache_key] = cached
+    return cached
+
+
+@dataclass(frozen=True)
+class _PromptLayerSet:
+    """Built layers plus the platform/agent contents already split out."""
+
+    layers: list[PromptLayer]
+    platform_content: str
+    agent_content: str
 
 
 def _build_prompt_layers(
@@ -160,10 +219,10 @@ def _build_prompt_layers(
     model_name: str | None,
     skills: list[SkillMetadata] | None = None,
     memory_ctx: MemoryContext | None = None,
-) -> list[PromptLayer]:
+) -> _PromptLayerSet:
     """Build prompt layers for the multi-SystemMessage structure.
 
-    Returns a list of PromptLayer objects:
+    Returns a _PromptLayerSet whose layers are:
     - PLATFORM: MetaInstruction + Context + ToolInstruction + SkillMetadata + Format
     - AGENT: PersonaBlock (custom instructions)
     - CORE_MEMORY: Core memory profile (changes occasionally)
@@ -171,22 +230,19 @@ def _build_prompt_layers(
 
     Image models only return a single AGENT layer.
     """
-    agent_content = PersonaBlock(config).build().strip()
+    agent_content, meta_content, tail_content = _static_layer_contents(config, agent, model_name, skills or [])
 
     if _is_image_model(model_name):
-        return [PromptLayer(PromptLayerKind.AGENT, agent_content)]
+        return _PromptLayerSet(
+            layers=[PromptLayer(PromptLayerKind.AGENT, agent_content)],
+            platform_content="",
+            agent_content=agent_content,
+        )
 
     _mem = memory_ctx or MemoryContext()
 
-    # PLATFORM layer: static platform policy + tools + formatting
-    platform_parts = [
-        MetaInstructionBlock(config).build(),
-        ContextBlock(config).build(),
-        ToolInstructionBlock(config, agent).build(),
-        SkillMetadataBlock(skills or []).build(),
-        FormatBlock(config, model_name).build(),
-    ]
-    platform_content = _join_non_empty(platform_parts)
+    # PLATFORM layer: cached static policy/tooling around the live ContextBlock
+    platform_content = _join_non_empty([meta_content, ContextBlock(config).build(), tail_content])
 
     # Memory layers (separated from platform for cacheability)
     core_memory_content = (
@@ -199,40 +255,50 @@ def _build_prompt_layers(
     )
     auto_memory_content = AutoRetrievedMemoriesBlock(_mem.auto_retrieved).build().strip()
 
-    return [
-        PromptLayer(PromptLayerKind.PLATFORM, platform_content),
-        PromptLayer(PromptLayerKind.AGENT, agent_content),
-        PromptLayer(PromptLayerKind.CORE_MEMORY, core_memory_content),
-        PromptLayer(PromptLayerKind.AUTO_MEMORY, auto_memory_content),
-    ]
+    return _PromptLayerSet(
+        layers=[
+            PromptLayer(PromptLayerKind.PLATFORM, platform_content),
+            PromptLayer(PromptLayerKind.AGENT, agent_content),
+            PromptLayer(PromptLayerKind.CORE_MEMORY, core_memory_content),
+            PromptLayer(PromptLayerKind.AUTO_MEMORY, auto_memory_content),
+        ],
+        platform_content=platform_content,
+        agent_content=agent_content,
+    )
 
 
-def _build_prompt_provenance(
+def _agent_prompt_source(
     graph_config: dict[str, Any] | None,
     agent_prompt: str | None,
-    platform_prompt: str,
     agent_prompt_layer: str,
-    final_prompt: str,
-    model_name: str | None,
-    memory_ctx: MemoryContext | None = None,
-) -> dict[str, Any]:
+) -> str:
+    """Determine which source fed the PersonaBlock (single config-dict walk)."""
     prompt_config_raw: Any = graph_config.get("prompt_config", {}) if graph_config else {}
     custom_instructions: str | None = None
     if isinstance(prompt_config_raw, dict):
         raw_custom = prompt_config_raw.get("custom_instructions")
         if isinstance(raw_custom, str):
             custom_instructions = raw_custom
-    has_graph_custom = bool(custom_instructions and custom_instructions.strip())
+    if custom_instructions and custom_instructions.strip():
+        return "graph_config.prompt_config"
+    return "agent.prompt_fallback" if agent_prompt and agent_prompt_layer else "none"
 
+
+def _build_prompt_provenance(
+    agent_prompt_source: str,
+    platform_prompt: str,
+    agent_prompt_layer: str,
+    final_prompt: str,
+    model_name: str | None,
+    memory_ctx: MemoryContext | None = None,
+) -> dict[str, Any]:
     _mem = memory_ctx or MemoryContext()
     return {
         "layer_order": ["platform_policy_prompt", "agent_prompt", "node_prompt"],
         "model_name": model_name,
         "has_platform_policy_prompt": bool(platform_prompt),
         "has_agent_prompt": bool(agent_prompt_layer),
-        "agent_prompt_source": "graph_config.prompt_config"
-        if has_graph_custom
-        else ("agent.prompt_fallback" if agent_prompt and agent_prompt_layer else "none"),
+        "agent_prompt_source": agent_prompt_source,
         "platform_policy_chars": len(platform_prompt),
         "agent_prompt_chars": len(agent_prompt_layer),
         "final_system_prompt_chars": len(final_prompt),
@@ -270,28 +336,18 @@ async def build_system_prompt_layers(
     if agent and agent.id:
         skills = await _load_skill_metadata(db, agent.id)
 
-    layers = _build_prompt_layers(prompt_config, agent, model_name, skills=skills, memory_ctx=memory_ctx)
-    flat_prompt = _join_non_empty([layer.content for layer in layers if layer.content.strip()])
-
-    # Extract platform/agent content for provenance
-    platform_prompt = ""
-    agent_prompt_layer = ""
-    for layer in layers:
-        if layer.kind == PromptLayerKind.PLATFORM:
-            platform_prompt = layer.content
-        elif layer.kind == PromptLayerKind.AGENT:
-            agent_prompt_layer = layer.content
+    layer_set = _build_prompt_layers(prompt_config, agent, model_name, skills=skills, memory_ctx=memory_ctx)
+    flat_prompt = _join_non_empty([layer.content for layer in layer_set.layers])
 
     provenance = _build_prompt_provenance(
-        graph_config=graph_config,
-        agent_prompt=agent_prompt,
-        platform_prompt=platform_prompt,
-        agent_prompt_layer=agent_prompt_layer,
+        agent_prompt_source=_agent_prompt_source(graph_config, agent_prompt, layer_set.agent_content),
+        platform_prompt=layer_set.platform_content,
+        agent_prompt_layer=layer_set.agent_content,
         final_prompt=flat_prompt,
         model_name=model_name,
         memory_ctx=memory_ctx,
     )
-    return SystemPromptLayers(layers=layers, provenance=provenance)
+    return SystemPromptLayers(layers=layer_set.layers, provenance=provenance)
 
 
 async def build_system_prompt_with_provenance(
@@ -93,15 +93,12 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     from app.core.marketplace import BuiltinMarketplacePublisher
 
     async def _ensure_builtin_listings() -> None:
-        async with AsyncSessionLocal() as db:
-            try:
-                publisher = BuiltinMarketplacePublisher(db)
-                listings = await publisher.ensure_builtin_listings()
-                await db.commit()
-                logger.info(f"Builtin marketplace listings ensured: {list(listings.keys())}")
-            except Exception as e:
-                logger.error(f"Failed to publish builtin agents to marketplace: {e}")
-                await db.rollback()
+        try:
+            # Fans out one session per builtin key; each key commits itself.
+            listings = await BuiltinMarketplacePublisher.ensure_builtin_listings_concurrent()
+            logger.info(f"Builtin marketplace listings ensured: {list(listings.keys())}")
+        except Exception as e:
+            logger.error(f"Failed to publish builtin agents to marketplace: {e}")
 
     await run_once("startup:builtin_listings", _ensure_builtin_listings)
 
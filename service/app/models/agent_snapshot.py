@@ -20,6 +20,12 @@ class AgentSnapshot(SQLModel, table=True):
         description="Complete agent config: {prompt, model, temperature, provider_id, tags, etc.}",
     )
 
+    # Fingerprint for cheap change detection without re-serializing the config
+    config_hash: str | None = Field(
+        default=None,
+        description="blake2b-128 hex of the canonical graph_config JSON (None for legacy rows)",
+    )
+
     # Linked resources (serialized for immutability)
     mcp_server_configs: list[dict[str, Any]] = Field(
         default_factory=list,
@@ -57,6 +63,7 @@ class AgentSnapshotCreate(SQLModel):
 
     agent_id: UUID
     configuration: dict[str, Any]
+    config_hash: str | None = None
     mcp_server_configs: list[dict[str, Any]] = []
     knowledge_set_config: dict[str, Any] | None = None
     skill_configs: list[dict[str, Any]] = []
@@ -104,6 +104,23 @@ class AgentMarketplaceRepository:
         result = await self.db.exec(statement)
         return result.first()
 
+    async def get_all_by_builtin_keys(self, builtin_keys: Sequence[str]) -> list[AgentMarketplace]:
+        """
+        Fetches marketplace listings for multiple builtin agent keys in one query.
+
+        Args:
+            builtin_keys: The builtin agent keys to look up.
+
+        Returns:
+            List of AgentMarketplace instances for the keys that have listings.
+        """
+        if not builtin_keys:
+            return []
+        logger.debug(f"Fetching marketplace listings for {len(builtin_keys)} builtin keys")
+        statement = select(AgentMarketplace).where(col(AgentMarketplace.builtin_key).in_(builtin_keys))
+        result = await self.db.exec(statement)
+        return list(result.all())
+
     async def update_listing(
         self, marketplace_id: UUID, update_data: AgentMarketplaceUpdate
     ) -> AgentMarketplace | None:
@@ -37,6 +37,7 @@ class AgentSnapshotRepository:
             agent_id=snapshot_data.agent_id,
             version=version,
             configuration=snapshot_data.configuration,
+            config_hash=snapshot_data.config_hash,
             mcp_server_configs=snapshot_data.mcp_server_configs,
             knowledge_set_config=snapshot_data.knowledge_set_config,
             skill_configs=snapshot_data.skill_configs,
@@ -63,6 +64,23 @@ class AgentSnapshotRepository:
         logger.debug(f"Fetching snapshot with id: {snapshot_id}")
         return await self.db.get(AgentSnapshot, snapshot_id)
 
+    async def get_snapshots_by_ids(self, snapshot_ids: Sequence[UUID]) -> list[AgentSnapshot]:
+        """
+        Fetches multiple snapshots by their IDs in one query.
+
+        Args:
+            snapshot_ids: The UUIDs of the snapshots to fetch.
+
+        Returns:
+            List of AgentSnapshot instances for the IDs that exist.
+        """
+        if not snapshot_ids:
+            return []
+        logger.debug(f"Fetching {len(snapshot_ids)} snapshots by id")
+        statement = select(AgentSnapshot).where(col(AgentSnapshot.id).in_(snapshot_ids))
+        result = await self.db.exec(statement)
+        return list(result.all())
+
     async def get_latest_snapshot(self, agent_id: UUID) -> AgentSnapshot | None:
         """
         Fetches the latest snapshot for an agent.
@@ -39,6 +39,37 @@ class MessageRepository:
         logger.debug(f"Fetching message with id: {message_id}")
         return await self.db.get(MessageModel, message_id)
 
+    async def get_message_with_owner(self, message_id: UUID) -> tuple[MessageModel, UUID, str] | None:
+        """
+        Fetches a message together with its topic ID and owning user in one query.
+
+        Joins Message -> Topic -> Session so authorization checks don't need
+        three sequential round-trips.
+
+        Args:
+            message_id: The UUID of the message to fetch.
+
+        Returns:
+            A (message, topic_id, user_id) tuple, or None if the message or its
+            topic/session chain does not exist.
+        """
+        from app.models.sessions import Session as SessionModel
+        from app.models.topic import Topic as TopicModel
+
+        logger.debug(f"Fetching message with owner for message_id: {message_id}")
+        statement = (
+            select(MessageModel, TopicModel.id, SessionModel.user_id)
+            .join(TopicModel, col(MessageModel.topic_id) == col(TopicModel.id))
+            .join(SessionModel, col(TopicModel.session_id) == col(SessionModel.id))
+            .where(MessageModel.id == message_id)
+        )
+        result = await self.db.exec(statement)
+        row = result.first()
+        if row is None:
+            return None
+        message, topic_id, user_id = row
+        return message, topic_id, user_id
+
     async def get_messages_by_topic(
         self, topic_id: UUID, order_by_created: bool = True, limit: int | None = None
     ) -> list[MessageModel]:
@@ -10,7 +10,7 @@ from __future__ import annotations
 from enum import StrEnum
 from typing import Annotated, Any, Literal
 
-from pydantic import BaseModel, ConfigDict, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, field_validator
 
 from app.schemas.prompt_config import PromptConfig
 
@@ -293,6 +293,14 @@ class GraphConfig(BaseModel):
 
     model_config = ConfigDict(extra="forbid")
 
+    # Set by canonicalize_graph_config on its output so downstream consumers
+    # (GraphCompiler) can skip re-canonicalizing an already-canonical config.
+    _canonical: bool = PrivateAttr(default=False)
+    # Opaque cache slot for the compiler's legacy bridge form. The canonical
+    # config instance is shared via the factory's digest cache, so deriving
+    # the legacy form once per instance avoids re-walking nodes per build.
+    _legacy_bridge: Any = PrivateAttr(default=None)
+
     schema_version: Literal["3.0"] = "3.0"
     key: str = Field(min_length=1)
     revision: int = Field(default=1, ge=1)
@@ -23,8 +23,9 @@ from app.tools.builtin.subagent.schemas import SpawnSubagentInput, SpawnSubagent
 if TYPE_CHECKING:
     from uuid import UUID
 
-    from langgraph.graph.state import CompiledStateGraph
     from langgraph.store.base import BaseStore
+
+    from app.agents.types import LazyCompiledGraph
     from sqlmodel.ext.asyncio.session import AsyncSession
 
     from app.core.providers import ProviderManager
@@ -312,7 +313,7 @@ async def _build_subagent_graph(
     model_name: str | None,
     current_depth: int,
     store: "BaseStore | None",
-) -> "CompiledStateGraph[Any, None, Any, Any]":
+) -> "LazyCompiledGraph":
     """
     Build the subagent's compiled graph — always a react agent.
     """
@@ -369,7 +370,7 @@ async def _build_subagent_graph(
 
 
 async def _run_subagent(
-    graph: "CompiledStateGraph[Any, None, Any, Any]",
+    graph: "LazyCompiledGraph",
     task: str,
     provider_id: str | None = None,
     model_name: str | None = None,